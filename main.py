@@ -12,7 +12,6 @@ from dotenv import load_dotenv
 from collections import defaultdict
 import threading
 import asyncio
-from google.cloud import monitoring_v3
 
 # GenAI service pool cleanup not needed
 from src.api.process import cleanup_processing_resources
@@ -29,8 +28,8 @@ from src.api import (
 from src.api.search import router as search_router, video_router
 from src.services.config_validator import validate_required_env_vars, AppConfig
 from src.auth import get_appcheck_service
-from src.utils.logging import StructuredLogger, RequestLoggingMiddleware
-from src.utils.error_handlers import register_error_handlers
+from src.utils.logging import StructuredLogger, RequestLoggingMiddleware, log_business_event
+from src.utils.error_handlers import DefaultJSONResponse, register_error_handlers
 
 load_dotenv()
 
@@ -80,6 +79,7 @@ app = FastAPI(
     docs_url="/docs" if environment != "production" else None,
     redoc_url="/redoc" if environment != "production" else None,
     lifespan=lifespan,
+    default_response_class=DefaultJSONResponse,
 )
 
 # Include API routers
@@ -167,7 +167,7 @@ class AppCheckHTTPMiddleware(BaseHTTPMiddleware):
             # Record unverified request metric with IP
             client_ip = request.headers.get("X-Forwarded-For", request.client.host)
             if "," in client_ip:
-                client_ip = client_ip.split(",")[0].strip()
+                client_ip = client_ip.partition(",")[0].strip()
             record_appcheck_metric("unverified", request.url.path, ip=client_ip)
 
             if self.required:
@@ -191,18 +191,18 @@ class AppCheckHTTPMiddleware(BaseHTTPMiddleware):
                 app_id = verification_result.get("app_id", "unknown")
                 client_ip = request.headers.get("X-Forwarded-For", request.client.host)
                 if "," in client_ip:
-                    client_ip = client_ip.split(",")[0].strip()
+                    client_ip = client_ip.partition(",")[0].strip()
                 record_appcheck_metric("verified", request.url.path, app_id, client_ip)
 
                 request.state.appcheck_verified = True
                 request.state.appcheck_claims = verification_result
-                logger.debug(f"App Check verified for app: {app_id}")
+                logger.debug("App Check verified", app_id=app_id)
                 return await call_next(request)
             else:
                 # Record invalid token metric with IP
                 client_ip = request.headers.get("X-Forwarded-For", request.client.host)
                 if "," in client_ip:
-                    client_ip = client_ip.split(",")[0].strip()
+                    client_ip = client_ip.partition(",")[0].strip()
                 record_appcheck_metric("invalid", request.url.path, ip=client_ip)
 
                 request.state.appcheck_verified = False
@@ -254,16 +254,6 @@ app.add_middleware(RequestLoggingMiddleware)
 
 appcheck_service = get_appcheck_service()
 
-# Initialize Google Cloud Monitoring
-try:
-    monitoring_client = monitoring_v3.MetricServiceClient()
-    project_name = f"projects/{project_id}"
-    logger.info("Google Cloud Monitoring initialized successfully")
-except Exception as e:
-    logger.warning(f"Failed to initialize Google Cloud Monitoring: {e}")
-    monitoring_client = None
-    project_name = None
-
 # App Check metrics tracking
 appcheck_metrics = {
     "verified_requests": 0,
@@ -276,8 +266,6 @@ appcheck_metrics_lock = threading.Lock()
 
 def log_structured_metric(metric_data: dict):
     """Log structured data for Google Cloud Logging to parse as JSON"""
-    from src.utils.logging import log_business_event
-
     # Use our structured logging for consistency
     log_business_event("appcheck_metric", metric_data)
 
@@ -387,10 +375,10 @@ def record_appcheck_metric(metric_type: str, path: str = "", app_id: str = "", i
 async def get_regional_health():
     """Get health status of all regions for load balancer routing"""
     try:
-        from src.services.genai_service_pool import GenAIServicePool
+        from src.services.genai_service_pool import get_genai_service_pool
         
-        # Initialize pool to check health
-        pool = GenAIServicePool()
+        # Reuse the shared pool to check health
+        pool = get_genai_service_pool()
         pool_size = pool.get_pool_size()
         current_region = os.getenv("CLOUD_RUN_REGION", "us-central1")
         
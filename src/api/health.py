@@ -5,6 +5,7 @@ Health check endpoints
 from fastapi import APIRouter, Request
 from datetime import datetime
 import logging
+import os
 
 from src.services.cache_service import CacheService
 from src.services.queue_service import QueueService
@@ -20,6 +21,13 @@ queue_service = QueueService()
 appcheck_service = get_appcheck_service()
 config = get_config_with_defaults()
 
+# Limits reported by /status; read once since they only change on redeploy
+MAX_DIRECT_PROCESSING = int(os.getenv("MAX_DIRECT_PROCESSING", "5"))
+RATE_LIMIT_REQUESTS = int(os.getenv("RATE_LIMIT_REQUESTS", "10"))
+RATE_LIMIT_WINDOW = int(os.getenv("RATE_LIMIT_WINDOW", "60"))
+MAX_CONCURRENT_PROCESSING = int(os.getenv("MAX_CONCURRENT_PROCESSING", "50"))
+APPCHECK_REQUIRED = os.getenv("APPCHECK_REQUIRED", "false").lower() == "true"
+
 
 @router.get("/health")
 @router.head("/health")
@@ -76,13 +84,6 @@ async def health():
 @router.get("/status")
 async def status():
     """Status endpoint showing current system load and queue status"""
-    from collections import defaultdict
-    import time
-    import os
-    import asyncio
-
-    current_time = time.time()
-
     # Get rate limiting info from main app (we'll need to refactor this)
     # For now, return basic status
 
@@ -102,24 +103,24 @@ async def status():
             "enabled": True,
             "direct_processing": {
                 "active": 0,  # Will be updated when we refactor main.py
-                "max": int(os.getenv("MAX_DIRECT_PROCESSING", "5")),
-                "available": int(os.getenv("MAX_DIRECT_PROCESSING", "5")),
+                "max": MAX_DIRECT_PROCESSING,
+                "available": MAX_DIRECT_PROCESSING,
             },
         },
         "rate_limiting": {
             "active_ips": 0,  # Will be updated when we refactor middleware
-            "limit_per_ip": int(os.getenv("RATE_LIMIT_REQUESTS", "10")),
-            "window_seconds": int(os.getenv("RATE_LIMIT_WINDOW", "60")),
+            "limit_per_ip": RATE_LIMIT_REQUESTS,
+            "window_seconds": RATE_LIMIT_WINDOW,
         },
         "processing_queue": {
             "available_slots": 40,  # Will be dynamic
-            "total_slots": int(os.getenv("MAX_CONCURRENT_PROCESSING", "50")),
+            "total_slots": MAX_CONCURRENT_PROCESSING,
             "utilization_percent": 0,  # Will be calculated
         },
         "cache": cache_stats,
         "queue": queue_stats,
         "app_check": {
-            "required": os.getenv("APPCHECK_REQUIRED", "false").lower() == "true",
+            "required": APPCHECK_REQUIRED,
             "stats": appcheck_stats,
         },
         "cloud_run": {
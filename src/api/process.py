@@ -3,7 +3,7 @@ Video processing endpoints
 """
 
 from fastapi import APIRouter, Request, Depends, HTTPException
-from typing import Union
+from typing import Awaitable, Optional, Union
 import asyncio
 import time
 import os
@@ -19,7 +19,7 @@ from src.models.requests import ProcessRequest
 from src.models.responses import RelationshipContent, QueuedResponse
 from src.services.cache_service import CacheService
 from src.services.queue_service import QueueService
-from src.services.genai_service import GenAIService
+from src.services.genai_service import GenAIService, HOOK_ANALYSIS_PROMPT_VERSION
 from src.worker.video_processor import VideoProcessor
 from src.auth import optional_appcheck_token
 from src.exceptions import NotFoundError, ProcessingError
@@ -35,6 +35,7 @@ video_processor = VideoProcessor()
 
 # Configuration
 MAX_DIRECT_PROCESSING = int(os.getenv("MAX_DIRECT_PROCESSING", "15"))
+APPCHECK_REQUIRED = os.getenv("APPCHECK_REQUIRED", "false").lower() == "true"
 active_direct_processing = 0
 
 
@@ -52,6 +53,25 @@ def _has_structured_recipe_data(data: dict) -> bool:
     return has_ingredients and has_instructions
 
 
+async def _extract_preview_image(
+    extraction: Optional[Awaitable[bytes]], label: str, request_id: str
+) -> Optional[str]:
+    """Await an image extraction and return it as a JPEG data URI, or None if it failed"""
+    if extraction is None:
+        return None
+    try:
+        image = await extraction
+    except Exception as e:
+        logger.error(
+            f"Failed to extract {label} - Request ID: {request_id}, Error: {e}", exc_info=True
+        )
+        return None
+    logger.info(
+        f"Successfully extracted {label} - Request ID: {request_id}, Image size: {len(image)} bytes"
+    )
+    return f"data:image/jpeg;base64,{base64.b64encode(image).decode('utf-8')}"
+
+
 async def process_video_direct(url: str, request_id: str, localization: str = None) -> dict:
     """Process video directly (not through queue)"""
     global active_direct_processing
@@ -74,7 +94,6 @@ async def process_video_direct(url: str, request_id: str, localization: str = No
         caption = metadata.get("caption", "")
         description = metadata.get("description", "")
         transcript = metadata.get("transcript_text")
-        extracted_image_base64 = None
 
         if is_slideshow:
             # Handle slideshow content
@@ -96,28 +115,18 @@ async def process_video_direct(url: str, request_id: str, localization: str = No
                     else:
                         transcript = slideshow_transcript_data
 
-                # Extract first image from slideshow
-                if slideshow_images:
-                    try:
-                        logger.info(
-                            f"Attempting to extract first slideshow image - Request ID: {request_id}, Image count: {len(slideshow_images)}"
-                        )
-                        first_image = await video_processor.extract_image_from_slideshow(
-                            slideshow_images
-                        )
-                        extracted_image_base64 = f"data:image/jpeg;base64,{base64.b64encode(first_image).decode('utf-8')}"
-                        logger.info(
-                            f"Successfully extracted first slideshow image - Request ID: {request_id}, Image size: {len(first_image)} bytes"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to extract slideshow image - Request ID: {request_id}, Error: {e}",
-                            exc_info=True,
-                        )
-
-                # Analyze slideshow with Gemini
-                content_json = await genai_service.analyze_slideshow_with_transcript(
-                    slideshow_images, transcript, caption, description, localization
+                # Analyze slideshow with Gemini, extracting the first image meanwhile
+                extracted_image_base64, content_json = await asyncio.gather(
+                    _extract_preview_image(
+                        video_processor.extract_image_from_slideshow(slideshow_images)
+                        if slideshow_images
+                        else None,
+                        "first slideshow image",
+                        request_id,
+                    ),
+                    genai_service.analyze_slideshow_with_transcript(
+                        slideshow_images, transcript, caption, description, localization
+                    ),
                 )
             else:
                 # Handle Instagram slideshows - same pattern as TikTok
@@ -129,54 +138,34 @@ async def process_video_direct(url: str, request_id: str, localization: str = No
                 if slideshow_transcript_data:
                     transcript = slideshow_transcript_data
 
-                # Extract first image from slideshow
-                if slideshow_images:
-                    try:
-                        logger.info(
-                            f"Attempting to extract first Instagram slideshow image - Request ID: {request_id}, Image count: {len(slideshow_images)}"
-                        )
-                        first_image = await video_processor.extract_image_from_slideshow(
-                            slideshow_images
-                        )
-                        extracted_image_base64 = f"data:image/jpeg;base64,{base64.b64encode(first_image).decode('utf-8')}"
-                        logger.info(
-                            f"Successfully extracted first Instagram slideshow image - Request ID: {request_id}, Image size: {len(first_image)} bytes"
-                        )
-                    except Exception as e:
-                        logger.error(
-                            f"Failed to extract Instagram slideshow image - Request ID: {request_id}, Error: {e}",
-                            exc_info=True,
-                        )
-
-                # Analyze slideshow with Gemini
-                content_json = await genai_service.analyze_slideshow_with_transcript(
-                    slideshow_images, transcript, caption, description, localization
+                # Analyze slideshow with Gemini, extracting the first image meanwhile
+                extracted_image_base64, content_json = await asyncio.gather(
+                    _extract_preview_image(
+                        video_processor.extract_image_from_slideshow(slideshow_images)
+                        if slideshow_images
+                        else None,
+                        "first Instagram slideshow image",
+                        request_id,
+                    ),
+                    genai_service.analyze_slideshow_with_transcript(
+                        slideshow_images, transcript, caption, description, localization
+                    ),
                 )
         else:
             # Handle regular video content
             logger.info(f"Processing regular video - Request ID: {request_id}")
 
-            # Extract first frame from video
-            try:
-                logger.info(
-                    f"Attempting to extract first frame - Request ID: {request_id}, Video size: {len(video_content)} bytes"
-                )
-                first_frame = await video_processor.extract_first_frame(video_content)
-                extracted_image_base64 = (
-                    f"data:image/jpeg;base64,{base64.b64encode(first_frame).decode('utf-8')}"
-                )
-                logger.info(
-                    f"Successfully extracted first frame - Request ID: {request_id}, Frame size: {len(first_frame)} bytes"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to extract video frame - Request ID: {request_id}, Error: {e}",
-                    exc_info=True,
-                )
-
-            # Analyze with Gemini (no audio removal needed)
-            content_json = await genai_service.analyze_video_with_transcript(
-                video_content, transcript, caption, description, localization
+            # Analyze with Gemini (no audio removal needed), extracting the
+            # first frame locally while the request is in flight
+            extracted_image_base64, content_json = await asyncio.gather(
+                _extract_preview_image(
+                    video_processor.extract_first_frame(video_content),
+                    "first frame",
+                    request_id,
+                ),
+                genai_service.analyze_video_with_transcript(
+                    video_content, transcript, caption, description, localization
+                ),
             )
 
         if not content_json:
@@ -208,12 +197,21 @@ async def process_video_direct(url: str, request_id: str, localization: str = No
         if content_json.get("hook"):
             try:
                 logger.info(f"Analyzing hook for video - Request ID: {request_id}")
-                analysis = await genai_service.analyze_hook(
+                hook_args = (
                     content_json["hook"],
                     content_json.get("transcript", "")[:1000],
                     content_json.get("format"),
                     content_json.get("niche"),
                 )
+                # Reposts share hooks, so analyses are cached by prompt content
+                analysis_key = cache_service.generate_llm_cache_key(
+                    genai_service.model, HOOK_ANALYSIS_PROMPT_VERSION, *hook_args
+                )
+                analysis = await cache_service.get_cached_llm_response(analysis_key)
+                if analysis is None:
+                    analysis = await genai_service.analyze_hook(*hook_args)
+                    if analysis:
+                        await cache_service.cache_llm_response(analysis_key, analysis)
                 content_json["analysis"] = analysis
                 logger.info(f"Hook analysis completed - Request ID: {request_id}")
             except Exception as e:
@@ -251,15 +249,14 @@ async def process_video(
     request_id = getattr(req.state, "request_id", "unknown")
 
     # Log App Check status
-    appcheck_required = os.getenv("APPCHECK_REQUIRED", "false").lower() == "true"
     if appcheck_claims:
         logger.info(
             f"Request verified with App Check - App ID: {appcheck_claims.get('app_id')} - Request ID: {request_id}"
         )
-    elif appcheck_required:
+    elif APPCHECK_REQUIRED:
         logger.warning(f"App Check required but not provided - Request ID: {request_id}")
     else:
-        logger.debug(f"App Check not provided (optional) - Request ID: {request_id}")
+        logger.debug("App Check not provided (optional)", request_id=request_id)
 
     # Check cache first
     cached_video = await cache_service.get_cached_video(
@@ -281,29 +278,30 @@ async def process_video(
         )
         cache_service.invalidate_cache(request.url, request.localization)
 
-    # Check if already in queue (with localization)
-    existing_job = await queue_service.get_job_by_url(request.url, status="pending", localization=request.localization)
-    if existing_job:
+    # Check if already queued or processing (with localization) in one lookup
+    active_job = await queue_service.get_job_by_url(
+        request.url, localization=request.localization, statuses=["pending", "processing"]
+    )
+    if active_job:
+        if active_job.get("status") == "processing":
+            logger.info(
+                f"Video already processing - Request ID: {request_id}, Job ID: {active_job['job_id']}"
+            )
+            return QueuedResponse(
+                status="processing",
+                job_id=active_job["job_id"],
+                message="Video is currently being processed",
+                check_url=f"/status/{active_job['job_id']}",
+            )
+
         logger.info(
-            f"Video already queued - Request ID: {request_id}, Job ID: {existing_job['job_id']}"
+            f"Video already queued - Request ID: {request_id}, Job ID: {active_job['job_id']}"
         )
         return QueuedResponse(
             status="queued",
-            job_id=existing_job["job_id"],
+            job_id=active_job["job_id"],
             message="Video already queued for processing",
-            check_url=f"/status/{existing_job['job_id']}",
-        )
-
-    processing_job = await queue_service.get_job_by_url(request.url, status="processing", localization=request.localization)
-    if processing_job:
-        logger.info(
-            f"Video already processing - Request ID: {request_id}, Job ID: {processing_job['job_id']}"
-        )
-        return QueuedResponse(
-            status="processing",
-            job_id=processing_job["job_id"],
-            message="Video is currently being processed",
-            check_url=f"/status/{processing_job['job_id']}",
+            check_url=f"/status/{active_job['job_id']}",
         )
 
     # Try direct processing if we have capacity
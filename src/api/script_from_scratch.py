@@ -44,7 +44,7 @@ async def generate_scripts_from_scratch(
     Returns 3 script options, each with 4 beats: hook, context, value, cta.
     """
     request_id = getattr(req.state, "request_id", "unknown")
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
 
     logger.info(
         f"Script from scratch request - Request ID: {request_id}, "
@@ -92,7 +92,7 @@ async def generate_scripts_from_scratch(
                 )
             )
 
-        generation_time_ms = int((time.time() - start_time) * 1000)
+        generation_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
 
         response = GenerateScriptsFromScratchResponse(
             success=True,
@@ -151,7 +151,7 @@ async def refine_beat(
     - cta: swap_cta, add_keyword_prompt, less_salesy
     """
     request_id = getattr(req.state, "request_id", "unknown")
-    start_time = time.time()
+    start_ns = time.monotonic_ns()
 
     logger.info(
         f"Refine beat request - Request ID: {request_id}, "
@@ -180,7 +180,7 @@ async def refine_beat(
             action_applied=result.get("action_applied", request.action.value),
         )
 
-        generation_time_ms = int((time.time() - start_time) * 1000)
+        generation_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
         logger.info(
             f"Refine beat completed - Request ID: {request_id}, "
             f"Time: {generation_time_ms}ms, Action: {request.action.value}"
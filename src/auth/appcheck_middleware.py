@@ -72,7 +72,7 @@ class AppCheckMiddleware:
                 # Token is valid
                 request.state.appcheck_verified = True
                 request.state.appcheck_claims = verification_result
-                logger.debug(f"App Check verified for app: {verification_result.get('app_id')}")
+                logger.debug("App Check verified for app: %s", verification_result.get('app_id'))
                 return await call_next(request)
             else:
                 # Token is invalid
@@ -13,6 +13,13 @@ from starlette.middleware.base import BaseHTTPMiddleware
 
 logger = logging.getLogger(__name__)
 
+# Path fragments that indicate traversal attempts or common probes
+_SUSPICIOUS_PATH_PATTERNS = (
+    "../", "..\\", "/etc/", "/proc/", "/sys/", "passwd", "shadow", "/.git", "/.env",
+    "/admin", "/wp-admin", "/phpmyadmin", "/config", "/.well-known",
+)
+_OBVIOUS_ATTACK_PATTERNS = ("/.git", "/.env", "/wp-admin", "/phpmyadmin")
+
 
 class ThreatDetector:
     """Advanced threat detection and monitoring"""
@@ -59,8 +66,8 @@ class ThreatDetector:
                 })
         
         # Detect path traversal attempts and common attack patterns
-        suspicious_paths = ["../", "..\\", "/etc/", "/proc/", "/sys/", "passwd", "shadow", "/.git", "/.env", "/admin", "/wp-admin", "/phpmyadmin", "/config", "/.well-known"]
-        if any(pattern in path.lower() for pattern in suspicious_paths):
+        path_lower = path.lower()
+        if any(pattern in path_lower for pattern in _SUSPICIOUS_PATH_PATTERNS):
             self.suspicious_patterns[f"traversal_{ip}"] += 1
             self._log_security_event("path_traversal", ip, {
                 "attempted_path": path,
@@ -68,7 +75,7 @@ class ThreatDetector:
             })
             
             # Log obvious attack patterns but don't immediately block IP (allow legitimate access)
-            if any(obvious_attack in path.lower() for obvious_attack in ["/.git", "/.env", "/wp-admin", "/phpmyadmin"]):
+            if any(obvious_attack in path_lower for obvious_attack in _OBVIOUS_ATTACK_PATTERNS):
                 self._log_security_event("attack_pattern_detected", ip, {
                     "reason": "obvious_attack_pattern",
                     "attempted_path": path,
@@ -172,7 +179,7 @@ class EnhancedRateLimiter:
         """Get real client IP handling proxy headers"""
         forwarded = request.headers.get("X-Forwarded-For")
         if forwarded:
-            return forwarded.split(",")[0].strip()
+            return forwarded.partition(",")[0].strip()
         return request.client.host
     
     def _rate_limit_response(self, message: str, retry_after: int) -> JSONResponse:
@@ -1,6 +1,10 @@
+import re
 from typing import Optional, List
 from pydantic import BaseModel
 
+# Hashtags in a post caption or description, as stored in VideoMetadata.hashtags
+HASHTAG_RE = re.compile(r"#\w+")
+
 
 class SlideshowImage(BaseModel):
     """Individual image in a slideshow"""
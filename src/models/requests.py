@@ -7,6 +7,17 @@ from typing import Optional, Dict
 from enum import Enum
 import re
 
+# Basic URL shape accepted by request models
+_URL_RE = re.compile(
+    r"^https?://"  # http:// or https://
+    r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
+    r"localhost|"  # localhost...
+    r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
+    r"(?::\d+)?"  # optional port
+    r"(?:/?|[/?]\S+)$",
+    re.IGNORECASE,
+)
+
 
 # =============================================================================
 # Enums for Script Generation From Scratch
@@ -104,17 +115,7 @@ class ProcessRequest(BaseModel):
             raise ValueError("URL cannot be empty")
 
         # Basic URL validation
-        url_pattern = re.compile(
-            r"^https?://"  # http:// or https://
-            r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
-            r"localhost|"  # localhost...
-            r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
-            r"(?::\d+)?"  # optional port
-            r"(?:/?|[/?]\S+)$",
-            re.IGNORECASE,
-        )
-
-        if not url_pattern.match(v):
+        if not _URL_RE.match(v):
             raise ValueError("Invalid URL format")
 
         return v
@@ -8,10 +8,12 @@ import os
 import asyncio
 import time
 from typing import Optional, Dict, Any
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from urllib.parse import urlparse, parse_qs, urlencode
 from dotenv import load_dotenv
 
+from src.services.firestore_client import count_documents, get_firestore_client
+
 # Load environment variables
 load_dotenv()
 
@@ -31,6 +33,9 @@ class CacheService:
         # Default TTL for cached content (365 days - video content is immutable)
         # If Joe saves a video Dec 10, Stacy saves same video April 15 = instant cache hit
         self.default_ttl_hours = int(os.getenv("CACHE_TTL_HOURS", "8760"))  # 24 * 365 = 8760 hours
+
+        # TTL for cached model responses keyed by prompt content (7 days)
+        self.llm_cache_ttl_hours = int(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
         
         # Connection configuration with more aggressive timeouts
         self.operation_timeout = 30  # 30 seconds for operations
@@ -57,9 +62,10 @@ class CacheService:
         for attempt in range(max_attempts):
             try:
                 # Initialize Firestore client with timeout
-                self.db = firestore.Client(project=self.project_id)
+                self.db = get_firestore_client(self.project_id)
                 self.collection_name = "parser_cache"
                 self.cache_collection = self.db.collection(self.collection_name)
+                self.llm_cache_collection = self.db.collection("llm_cache")
                 
                 # Test connection with a very simple operation and short timeout
                 try:
@@ -158,8 +164,11 @@ class CacheService:
             cache_key = self._generate_cache_key(tiktok_url, localization)
             doc_ref = self.cache_collection.document(cache_key)
             
-            # Use shorter timeout and retry policy to prevent long hangs
-            doc = doc_ref.get(timeout=self.connection_timeout, retry=self.retry_policy)
+            # Use shorter timeout and retry policy to prevent long hangs. The
+            # client is synchronous, so the RPC runs in a worker thread.
+            doc = await asyncio.to_thread(
+                doc_ref.get, timeout=self.connection_timeout, retry=self.retry_policy
+            )
 
             if doc.exists:
                 cached_data = doc.to_dict()
@@ -184,7 +193,7 @@ class CacheService:
 
                     if now > expires_at:
                         # Document expired, delete it
-                        doc_ref.delete()
+                        await asyncio.to_thread(doc_ref.delete)
                         logger.info(f"Cache EXPIRED for URL: {tiktok_url[:50]}...")
                         return None
 
@@ -251,7 +260,9 @@ class CacheService:
 
             # Store in Firestore with timeout and retry
             doc_ref = self.cache_collection.document(cache_key)
-            doc_ref.set(cache_data, timeout=self.operation_timeout, retry=self.retry_policy)
+            await asyncio.to_thread(
+                doc_ref.set, cache_data, timeout=self.operation_timeout, retry=self.retry_policy
+            )
 
             localization_info = f" [{localization}]" if localization else ""
             logger.info(
@@ -269,6 +280,84 @@ class CacheService:
             logger.error(f"Error caching bucket list: {e}")
             return False
 
+    @staticmethod
+    def generate_llm_cache_key(*parts: Optional[str]) -> str:
+        """
+        Generate a cache key for a model response from everything that shapes
+        the prompt (model, prompt version, inputs). Text inputs are stripped so
+        whitespace-only differences share an entry.
+        """
+        cache_input = "|".join((part or "").strip() for part in parts)
+        return hashlib.sha256(cache_input.encode()).hexdigest()
+
+    async def get_cached_llm_response(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a cached model response.
+
+        Args:
+            cache_key: Key from generate_llm_cache_key
+
+        Returns:
+            Cached response if found and not expired, None otherwise
+        """
+        if not self.db:
+            return None
+
+        try:
+            doc = await asyncio.to_thread(
+                self.llm_cache_collection.document(cache_key).get,
+                timeout=self.connection_timeout,
+                retry=self.retry_policy,
+            )
+            if not doc.exists:
+                logger.info("LLM cache MISS for key: %s", cache_key[:16])
+                return None
+
+            cached_data = doc.to_dict()
+            expires_at = cached_data.get("expires_at")
+            if expires_at and datetime.now(timezone.utc) > expires_at:
+                logger.info("LLM cache EXPIRED for key: %s", cache_key[:16])
+                return None
+
+            logger.info("LLM cache HIT for key: %s", cache_key[:16])
+            return cached_data.get("response")
+
+        except Exception as e:
+            logger.error(f"Error retrieving LLM response from cache: {e}")
+            return None
+
+    async def cache_llm_response(self, cache_key: str, response: Dict[str, Any]) -> bool:
+        """
+        Cache a model response.
+
+        Args:
+            cache_key: Key from generate_llm_cache_key
+            response: Parsed model response
+
+        Returns:
+            True if cached successfully, False otherwise
+        """
+        if not self.db:
+            return False
+
+        try:
+            now = datetime.now(timezone.utc)
+            await asyncio.to_thread(
+                self.llm_cache_collection.document(cache_key).set,
+                {
+                    "response": response,
+                    "created_at": now,
+                    "expires_at": now + timedelta(hours=self.llm_cache_ttl_hours),
+                },
+                timeout=self.operation_timeout,
+                retry=self.retry_policy,
+            )
+            return True
+
+        except Exception as e:
+            logger.error(f"Error caching LLM response: {e}")
+            return False
+
     def invalidate_cache(self, tiktok_url: str, localization: Optional[str] = None) -> bool:
         """
         Invalidate cached video for a specific TikTok URL and localization.
@@ -310,9 +399,8 @@ class CacheService:
             return {"status": "disabled", "reason": "Firestore not connected"}
 
         try:
-            # Get count of cached documents
-            docs = self.cache_collection.limit(1000).stream()  # Limit to avoid expensive queries
-            total_docs = sum(1 for _ in docs)
+            # Get count of cached documents with a server-side aggregation
+            total_docs = count_documents(self.cache_collection)
 
             # Get sample of recent documents for stats
             recent_docs = (
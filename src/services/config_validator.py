@@ -180,9 +180,9 @@ def validate_firestore_connection(project_id: str) -> bool:
         True if connection is valid, False otherwise
     """
     try:
-        from google.cloud import firestore
+        from src.services.firestore_client import get_firestore_client
 
-        db = firestore.Client(project=project_id)
+        db = get_firestore_client(project_id)
         # Test connection by attempting to get a collection reference
         db.collection("test").limit(1).stream()
         logger.info(f"Firestore connection validated for project: {project_id}")
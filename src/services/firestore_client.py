@@ -0,0 +1,48 @@
+"""
+Shared Firestore client.
+
+Each firestore.Client owns its own gRPC channel and credentials, so services
+share one client per project instead of constructing their own.
+"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+from google.cloud import firestore
+
+logger = logging.getLogger(__name__)
+
+_clients: Dict[str, firestore.Client] = {}
+_clients_lock = threading.Lock()
+
+
+def get_firestore_client(project_id: str) -> firestore.Client:
+    """
+    Get the process-wide Firestore client for a project, creating it on first use.
+
+    Construction errors propagate to the caller and nothing is cached, so
+    callers that retry initialization will attempt a fresh client.
+    """
+    client = _clients.get(project_id)
+    if client is not None:
+        return client
+
+    with _clients_lock:
+        client = _clients.get(project_id)
+        if client is None:
+            client = firestore.Client(project=project_id)
+            _clients[project_id] = client
+            logger.info(f"Created shared Firestore client for project: {project_id}")
+        return client
+
+
+def count_documents(query, timeout: Optional[float] = None) -> int:
+    """
+    Count the documents matched by a collection or query server-side.
+
+    Uses a COUNT aggregation, so only the resulting integer crosses the wire
+    instead of every matching document.
+    """
+    results = query.count(alias="total").get(timeout=timeout)
+    return int(results[0][0].value)
@@ -1,15 +1,11 @@
 from google import genai
 from google.genai.types import HttpOptions, Part, GenerateContentConfig
 from typing import Dict, Any, Optional, List
-import json
 import logging
 import time
-import random
 import asyncio
 import os
-import io
 try:
-    from PIL import Image
     import pillow_heif
     # Register HEIF opener with PIL
     pillow_heif.register_heif_opener()
@@ -17,8 +13,28 @@ try:
 except ImportError:
     PILLOW_AVAILABLE = False
 
+from src.utils.async_helpers import decorrelated_jitter
+from src.utils.image_converter import convert_heic_to_jpeg, sniff_image_format
+from src.utils.json_utils import json_loads
+
 logger = logging.getLogger(__name__)
 
+# Generation settings are the same for every request, so they are built once
+_EXTRACTION_CONFIG = GenerateContentConfig(
+    max_output_tokens=4096,  # Increased for complex recipes with many ingredients/steps
+    temperature=0.1,
+    top_p=0.8,
+    response_mime_type="application/json",  # Force JSON response
+)
+# Bump when the hook analysis prompt changes so cached analyses are not reused
+HOOK_ANALYSIS_PROMPT_VERSION = "v1"
+_HOOK_ANALYSIS_CONFIG = GenerateContentConfig(
+    max_output_tokens=2048,
+    temperature=0.3,
+    top_p=0.8,
+    response_mime_type="application/json",
+)
+
 # Video format categories - how the video is produced/presented
 VIDEO_FORMATS = [
     "voiceover",           # Voice narration over footage/B-roll
@@ -70,96 +86,8 @@ CONTENT_NICHES = [
 ]
 
 
-class GenAIService:
-    def __init__(self, config=None):
-        # Get configuration
-        if config is None:
-            from src.services.config_validator import AppConfig
-
-            config = AppConfig.from_env()
-
-        # Get project ID from configuration
-        project_id = config.project_id
-        if not project_id:
-            raise ValueError("GOOGLE_CLOUD_PROJECT_ID not set in configuration")
-
-        # Get local region for GenAI calls (default to us-central1)
-        local_region = os.getenv("CLOUD_RUN_REGION", "us-central1")
-        
-        # Initialize Google Gen AI SDK with Vertex AI backend using local region
-        self.client = genai.Client(
-            project=project_id,
-            location=local_region,
-            vertexai=True,  # Use Vertex AI backend
-            http_options=HttpOptions(api_version="v1"),
-        )
-        self.model = "gemini-2.0-flash-lite"
-        self.last_request_time = 0
-        self.min_request_interval = config.rate_limiting.genai_min_interval
-        self.max_retries = config.rate_limiting.genai_max_retries
-
-    async def _retry_with_backoff(self, func, max_retries=None, base_delay=1):
-        """Retry function with exponential backoff for 429 errors"""
-        if max_retries is None:
-            max_retries = self.max_retries
-        for attempt in range(max_retries):
-            try:
-                return func()
-            except Exception as e:
-                error_str = str(e)
-                if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
-                    if attempt == max_retries - 1:
-                        logger.error(f"Max retries ({max_retries}) reached for 429 error")
-                        raise e
-
-                    # Exponential backoff with jitter
-                    delay = base_delay * (2**attempt) + random.uniform(0, 1)
-                    logger.warning(
-                        f"Got 429 error, retrying in {delay:.2f} seconds "
-                        f"(attempt {attempt + 1}/{max_retries})"
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    # Non-429 error, don't retry
-                    raise e
-        return None
-
-    async def _rate_limit(self):
-        """Ensure minimum time between requests"""
-        current_time = time.time()
-        time_since_last_request = current_time - self.last_request_time
-        if time_since_last_request < self.min_request_interval:
-            sleep_time = self.min_request_interval - time_since_last_request
-            logger.info(f"Rate limiting: waiting {sleep_time:.2f} seconds")
-            await asyncio.sleep(sleep_time)
-        self.last_request_time = time.time()
-
-    async def analyze_video_with_transcript(
-        self,
-        video_content: bytes,
-        transcript: Optional[str] = None,
-        caption: Optional[str] = None,
-        description: Optional[str] = None,
-        localization: Optional[str] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """Analyze video/post with Gemini 2.0 Flash for creator content extraction"""
-
-        # Apply rate limiting
-        await self._rate_limit()
-
-        # Build prompt for creator content extraction
-        prompt = "You are an expert content analyst specializing in extracting transcripts and hooks from social media videos for content creators."
-
-        if transcript:
-            prompt += f"\n\nEXISTING TRANSCRIPT (if available):\n{transcript}"
-
-        if caption:
-            prompt += f"\n\nCAPTION:\n{caption}"
-
-        if description:
-            prompt += f"\n\nDESCRIPTION:\n{description}"
-
-        prompt += """
+# Static instructions appended after the per-request context in analysis prompts
+_VIDEO_PROMPT_TAIL = """
 
 TASK: Analyze this video and extract the full transcript, hook, format, and niche. Content creators save videos to study hooks, scripts, and content styles - your job is to provide accurate, complete analysis.
 
@@ -267,93 +195,7 @@ IMPORTANT:
 - Transcript accuracy is the most important thing - creators rely on this
 - Format and niche classification helps creators find similar content"""
 
-        # Prepare content for Google Gen AI SDK
-        contents = [prompt, Part.from_bytes(data=video_content, mime_type="video/mp4")]
-
-        # Generate content using Google Gen AI SDK with retry logic
-        def make_request():
-            return self.client.models.generate_content(
-                model=self.model,
-                contents=contents,
-                config=GenerateContentConfig(
-                    max_output_tokens=4096,  # Increased for complex recipes with many ingredients/steps
-                    temperature=0.1,
-                    top_p=0.8,
-                    response_mime_type="application/json",  # Force JSON response
-                ),
-            )
-
-        response = await self._retry_with_backoff(make_request, max_retries=5, base_delay=2)
-
-        # Parse response
-        try:
-            # Get the response text from the new API structure
-            response_text = response.text.strip()
-            logger.debug(f"Raw Gemini response: {response_text[:500]}...")  # Log first 500 chars
-
-            # Try to extract JSON from the response
-            # Sometimes Gemini adds markdown formatting or explanations
-            if "```json" in response_text:
-                # Extract JSON from markdown code block
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                # Extract from generic code block
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                response_text = response_text[json_start:json_end].strip()
-
-            parsed_json = json.loads(response_text)
-            logger.debug(f"Gemini returned image field: {parsed_json.get('image', 'NOT_SET')}")
-
-            # Apply emoji mapping to ingredients (hybrid approach)
-            parsed_json = self._apply_emoji_mapping(parsed_json)
-
-            return parsed_json
-        except Exception as e:
-            logger.error(f"Failed to parse Gemini response: {e}")
-            try:
-                logger.error(f"Full response object: {response}")
-            except Exception:
-                logger.error("Could not access response object")
-            return None
-
-    async def analyze_slideshow_with_transcript(
-        self,
-        slideshow_images: List[bytes],
-        transcript: Optional[str] = None,
-        caption: Optional[str] = None,
-        description: Optional[str] = None,
-        localization: Optional[str] = None,
-    ) -> Optional[Dict[str, Any]]:
-        """Analyze slideshow images with Gemini 2.0 Flash"""
-
-        # Apply rate limiting
-        await self._rate_limit()
-
-        # Build prompt for slideshow analysis (creator content extraction)
-        prompt = "You are an expert content analyst specializing in extracting transcripts, hooks, and content classification from social media slideshows for content creators."
-
-        if transcript:
-            prompt += f"\n\nTRANSCRIPT (audio from slideshow):\n{transcript}"
-
-        if caption:
-            prompt += f"\n\nCAPTION:\n{caption}"
-
-        if description:
-            prompt += f"\n\nDESCRIPTION:\n{description}"
-
-        # Add localization instructions if specified
-        localization_instruction = ""
-        if localization:
-            localization_instruction = f"\n\nIMPORTANT: Provide ALL text content (title, description, transcript) in {localization} language ONLY. Translate ALL human-readable text fields consistently. Maintain the exact JSON structure but translate all text to {localization}."
-
-        image_count = len(slideshow_images)
-        prompt += f"\n\nThis is a slideshow with {image_count} images. Analyze ALL the images together along with any transcript, caption, and description to extract creator content data. Content creators save slideshows to study hooks, scripts, and content styles."
-        prompt += localization_instruction
-
-        prompt += """
+_SLIDESHOW_PROMPT_TAIL = """
 
 Return your response as a valid JSON object with NO additional text, explanations, or formatting.
 
@@ -446,12 +288,198 @@ CRITICAL CONSISTENCY RULE: If localization is specified, ALL text fields (title,
 
 IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatting, no code blocks, no explanations before or after."""
 
+
+class GenAIService:
+    def __init__(self, config=None):
+        # Get configuration
+        if config is None:
+            from src.services.config_validator import AppConfig
+
+            config = AppConfig.from_env()
+
+        # Get project ID from configuration
+        project_id = config.project_id
+        if not project_id:
+            raise ValueError("GOOGLE_CLOUD_PROJECT_ID not set in configuration")
+
+        # Get local region for GenAI calls (default to us-central1)
+        local_region = os.getenv("CLOUD_RUN_REGION", "us-central1")
+        
+        # Initialize Google Gen AI SDK with Vertex AI backend using local region
+        self.client = genai.Client(
+            project=project_id,
+            location=local_region,
+            vertexai=True,  # Use Vertex AI backend
+            http_options=HttpOptions(api_version="v1"),
+        )
+        self.model = "gemini-2.0-flash-lite"
+        self.last_request_time = 0
+        self.min_request_interval = config.rate_limiting.genai_min_interval
+        self.max_retries = config.rate_limiting.genai_max_retries
+
+    async def _retry_with_backoff(self, func, max_retries=None, base_delay=1):
+        """Retry function with exponential backoff for 429 errors
+
+        The Gen AI SDK call is blocking, so it runs in a worker thread to keep
+        the event loop free for other requests.
+        """
+        if max_retries is None:
+            max_retries = self.max_retries
+        delay = base_delay
+        for attempt in range(max_retries):
+            try:
+                return await asyncio.to_thread(func)
+            except Exception as e:
+                error_str = str(e)
+                if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
+                    if attempt == max_retries - 1:
+                        logger.error(f"Max retries ({max_retries}) reached for 429 error")
+                        raise e
+
+                    # Decorrelated jitter so concurrent jobs don't retry in lockstep
+                    delay = decorrelated_jitter(delay, base_delay)
+                    logger.warning(
+                        f"Got 429 error, retrying in {delay:.2f} seconds "
+                        f"(attempt {attempt + 1}/{max_retries})"
+                    )
+                    await asyncio.sleep(delay)
+                else:
+                    # Non-429 error, don't retry
+                    raise e
+        return None
+
+    async def _rate_limit(self):
+        """Ensure minimum time between requests"""
+        current_time = time.monotonic()
+        time_since_last_request = current_time - self.last_request_time
+        if time_since_last_request < self.min_request_interval:
+            sleep_time = self.min_request_interval - time_since_last_request
+            logger.info(f"Rate limiting: waiting {sleep_time:.2f} seconds")
+            await asyncio.sleep(sleep_time)
+        self.last_request_time = time.monotonic()
+
+    async def analyze_video_with_transcript(
+        self,
+        video_content: bytes,
+        transcript: Optional[str] = None,
+        caption: Optional[str] = None,
+        description: Optional[str] = None,
+        localization: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Analyze video/post with Gemini 2.0 Flash for creator content extraction"""
+
+        # Apply rate limiting
+        await self._rate_limit()
+
+        # Build prompt for creator content extraction
+        parts = [
+            "You are an expert content analyst specializing in extracting transcripts and hooks from social media videos for content creators."
+        ]
+
+        if transcript:
+            parts.append(f"\n\nEXISTING TRANSCRIPT (if available):\n{transcript}")
+
+        if caption:
+            parts.append(f"\n\nCAPTION:\n{caption}")
+
+        if description:
+            parts.append(f"\n\nDESCRIPTION:\n{description}")
+
+        parts.append(_VIDEO_PROMPT_TAIL)
+        prompt = "".join(parts)
+
+        # Prepare content for Google Gen AI SDK
+        contents = [prompt, Part.from_bytes(data=video_content, mime_type="video/mp4")]
+
+        # Generate content using Google Gen AI SDK with retry logic
+        def make_request():
+            return self.client.models.generate_content(
+                model=self.model,
+                contents=contents,
+                config=_EXTRACTION_CONFIG,
+            )
+
+        response = await self._retry_with_backoff(make_request, max_retries=5, base_delay=2)
+
+        # Parse response
+        try:
+            # Get the response text from the new API structure
+            response_text = response.text.strip()
+            logger.debug("Raw Gemini response: %s...", response_text[:500])  # Log first 500 chars
+
+            # Try to extract JSON from the response
+            # Sometimes Gemini adds markdown formatting or explanations
+            if "```json" in response_text:
+                # Extract JSON from markdown code block
+                json_start = response_text.find("```json") + 7
+                json_end = response_text.find("```", json_start)
+                response_text = response_text[json_start:json_end].strip()
+            elif "```" in response_text:
+                # Extract from generic code block
+                json_start = response_text.find("```") + 3
+                json_end = response_text.find("```", json_start)
+                response_text = response_text[json_start:json_end].strip()
+
+            parsed_json = json_loads(response_text)
+            logger.debug("Gemini returned image field: %s", parsed_json.get("image", "NOT_SET"))
+
+            # Apply emoji mapping to ingredients (hybrid approach)
+            parsed_json = self._apply_emoji_mapping(parsed_json)
+
+            return parsed_json
+        except Exception as e:
+            logger.error(f"Failed to parse Gemini response: {e}")
+            try:
+                logger.error("Full response object: %s", response)
+            except Exception:
+                logger.error("Could not access response object")
+            return None
+
+    async def analyze_slideshow_with_transcript(
+        self,
+        slideshow_images: List[bytes],
+        transcript: Optional[str] = None,
+        caption: Optional[str] = None,
+        description: Optional[str] = None,
+        localization: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Analyze slideshow images with Gemini 2.0 Flash"""
+
+        # Apply rate limiting
+        await self._rate_limit()
+
+        # Build prompt for slideshow analysis (creator content extraction)
+        parts = [
+            "You are an expert content analyst specializing in extracting transcripts, hooks, and content classification from social media slideshows for content creators."
+        ]
+
+        if transcript:
+            parts.append(f"\n\nTRANSCRIPT (audio from slideshow):\n{transcript}")
+
+        if caption:
+            parts.append(f"\n\nCAPTION:\n{caption}")
+
+        if description:
+            parts.append(f"\n\nDESCRIPTION:\n{description}")
+
+        image_count = len(slideshow_images)
+        parts.append(
+            f"\n\nThis is a slideshow with {image_count} images. Analyze ALL the images together along with any transcript, caption, and description to extract creator content data. Content creators save slideshows to study hooks, scripts, and content styles."
+        )
+
+        # Add localization instructions if specified
+        if localization:
+            parts.append(
+                f"\n\nIMPORTANT: Provide ALL text content (title, description, transcript) in {localization} language ONLY. Translate ALL human-readable text fields consistently. Maintain the exact JSON structure but translate all text to {localization}."
+            )
+
+        parts.append(_SLIDESHOW_PROMPT_TAIL)
+        prompt = "".join(parts)
+
         # Prepare content with multiple images
         contents = [prompt]
 
         # Add all slideshow images to the analysis (convert to JPEG if needed)
-        from src.utils.image_converter import convert_image_to_jpeg
-
         valid_images = 0
         for i, image_content in enumerate(slideshow_images):
             if image_content and len(image_content) > 0:  # Skip empty image content
@@ -467,7 +495,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                                 try:
                                     image_content = self._convert_heic_to_jpeg(image_content)
                                     mime_type = "image/jpeg"
-                                    logger.debug(f"Converted HEIC image {i} to JPEG for Gemini compatibility")
+                                    logger.debug("Converted HEIC image %s to JPEG for Gemini compatibility", i)
                                 except Exception as conv_error:
                                     logger.warning(f"Failed to convert HEIC image {i} to JPEG: {conv_error}, skipping")
                                     continue
@@ -477,7 +505,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                             
                         contents.append(Part.from_bytes(data=image_content, mime_type=mime_type))
                         valid_images += 1
-                        logger.debug(f"Added image {i} to analysis (size: {len(image_content)} bytes, type: {mime_type})")
+                        logger.debug("Added image %s to analysis (size: %s bytes, type: %s)", i, len(image_content), mime_type)
                     except Exception as e:
                         logger.warning(f"Failed to add image {i} to analysis: {e}")
                 else:
@@ -492,12 +520,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
             return self.client.models.generate_content(
                 model=self.model,
                 contents=contents,
-                config=GenerateContentConfig(
-                    max_output_tokens=4096,  # Increased for complex recipes with many ingredients/steps
-                    temperature=0.1,
-                    top_p=0.8,
-                    response_mime_type="application/json",
-                ),
+                config=_EXTRACTION_CONFIG,
             )
 
         logger.info(f"Analyzing slideshow with {valid_images} images")
@@ -506,7 +529,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
         # Parse response
         try:
             response_text = response.text.strip()
-            logger.debug(f"Raw slideshow response: {response_text[:500]}...")
+            logger.debug("Raw slideshow response: %s...", response_text[:500])
 
             # Clean up response if needed
             if "```json" in response_text:
@@ -518,9 +541,9 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                 json_end = response_text.find("```", json_start)
                 response_text = response_text[json_start:json_end].strip()
 
-            parsed_json = json.loads(response_text)
+            parsed_json = json_loads(response_text)
             logger.debug(
-                f"Gemini slideshow returned image field: {parsed_json.get('image', 'NOT_SET')}"
+                "Gemini slideshow returned image field: %s", parsed_json.get("image", "NOT_SET")
             )
 
             # Apply emoji mapping to ingredients (hybrid approach)
@@ -576,12 +599,7 @@ Be specific and actionable. Focus on what psychological trigger makes viewers wa
             return self.client.models.generate_content(
                 model=self.model,
                 contents=[prompt],
-                config=GenerateContentConfig(
-                    max_output_tokens=2048,
-                    temperature=0.3,
-                    top_p=0.8,
-                    response_mime_type="application/json",
-                ),
+                config=_HOOK_ANALYSIS_CONFIG,
             )
 
         try:
@@ -589,7 +607,7 @@ Be specific and actionable. Focus on what psychological trigger makes viewers wa
 
             # Parse response
             response_text = response.text.strip()
-            logger.debug(f"Raw hook analysis response: {response_text[:500]}...")
+            logger.debug("Raw hook analysis response: %s...", response_text[:500])
 
             # Clean up response if needed
             if "```json" in response_text:
@@ -601,7 +619,7 @@ Be specific and actionable. Focus on what psychological trigger makes viewers wa
                 json_end = response_text.find("```", json_start)
                 response_text = response_text[json_start:json_end].strip()
 
-            parsed_json = json.loads(response_text)
+            parsed_json = json_loads(response_text)
             return parsed_json
 
         except Exception as e:
@@ -633,7 +651,7 @@ Be specific and actionable. Focus on what psychological trigger makes viewers wa
                 mapped_emoji = INGREDIENT_EMOJI_MAP.get(ingredient_name)
                 if mapped_emoji:
                     ingredient["emoji"] = mapped_emoji
-                    logger.debug(f"Applied predefined emoji '{mapped_emoji}' to '{ingredient_name}'")
+                    logger.debug("Applied predefined emoji '%s' to '%s'", mapped_emoji, ingredient_name)
 
         return recipe_data
 
@@ -641,66 +659,14 @@ Be specific and actionable. Focus on what psychological trigger makes viewers wa
         """Validate if the content is a valid image by checking headers"""
         if not content or len(content) < 10:
             return False
-            
-        # Check for common image format headers
-        # JPEG
-        if content.startswith(b'\xff\xd8\xff'):
-            return True
-        # PNG
-        if content.startswith(b'\x89PNG\r\n\x1a\n'):
-            return True
-        # WebP
-        if len(content) > 12 and content[8:12] == b'WEBP':
-            return True
-        # GIF
-        if content.startswith(b'GIF87a') or content.startswith(b'GIF89a'):
-            return True
-        # BMP
-        if content.startswith(b'BM'):
-            return True
-        # HEIC/HEIF (Apple's format used by TikTok)
-        if len(content) > 12:
-            # HEIC files have 'ftyp' at offset 4-8 and 'heic' or 'mif1' at offset 8-12
-            if content[4:8] == b'ftyp' and (content[8:12] == b'heic' or content[8:12] == b'mif1'):
-                return True
-            # Alternative HEIC signature
-            if content[4:8] == b'ftyp' and content[8:12] == b'heix':
-                return True
-            # Additional HEIC variants
-            if content[4:8] == b'ftyp' and content[8:12] == b'msf1':
-                return True
-            # Check for any MP4-based image format (which HEIC is based on)
-            if content[4:8] == b'ftyp':
-                return True
-        
-        # AVIF format (another modern image format)
-        if len(content) > 12 and content[4:8] == b'ftyp' and content[8:12] == b'avif':
-            return True
-            
-        return False
+        # One pass over the known magic numbers (JPEG, PNG, WebP, GIF, BMP, HEIC/AVIF)
+        return sniff_image_format(content) is not None
 
     def _get_image_mime_type(self, content: bytes) -> str:
         """Determine the MIME type of an image based on its content"""
-        if content.startswith(b'\xff\xd8\xff'):
-            return "image/jpeg"
-        elif content.startswith(b'\x89PNG\r\n\x1a\n'):
-            return "image/png"
-        elif len(content) > 12 and content[8:12] == b'WEBP':
-            return "image/webp"
-        elif content.startswith(b'GIF87a') or content.startswith(b'GIF89a'):
-            return "image/gif"
-        elif content.startswith(b'BM'):
-            return "image/bmp"
-        elif len(content) > 12 and content[4:8] == b'ftyp':
-            # Handle all MP4-based image formats (HEIC, AVIF, etc.)
-            if content[8:12] == b'avif':
-                return "image/avif"
-            else:
-                # Default to HEIC for other ftyp-based formats
-                return "image/heic"
-        else:
-            # Default to JPEG if we can't determine the type
-            return "image/jpeg"
+        image_format = sniff_image_format(content)
+        # Default to JPEG if we can't determine the type
+        return f"image/{image_format}" if image_format else "image/jpeg"
 
     def _convert_heic_to_jpeg(self, heic_content: bytes) -> bytes:
         """Convert HEIC image content to JPEG format"""
@@ -708,19 +674,9 @@ Be specific and actionable. Focus on what psychological trigger makes viewers wa
             raise RuntimeError("Pillow and pillow-heif are required for HEIC conversion")
         
         try:
-            # Open HEIC image from bytes
-            heic_image = Image.open(io.BytesIO(heic_content))
-            
-            # Convert to RGB if necessary (HEIC can be in different color modes)
-            if heic_image.mode != 'RGB':
-                heic_image = heic_image.convert('RGB')
-            
-            # Save as JPEG to bytes buffer
-            jpeg_buffer = io.BytesIO()
-            heic_image.save(jpeg_buffer, format='JPEG', quality=85, optimize=True)
-            jpeg_content = jpeg_buffer.getvalue()
+            jpeg_content = convert_heic_to_jpeg(heic_content)
             
-            logger.debug(f"Converted HEIC image ({len(heic_content)} bytes) to JPEG ({len(jpeg_content)} bytes)")
+            logger.debug("Converted HEIC image (%s bytes) to JPEG (%s bytes)", len(heic_content), len(jpeg_content))
             return jpeg_content
             
         except Exception as e:
@@ -7,12 +7,10 @@ from typing import Dict, Any, Optional, List
 import json
 import os
 import time
-import random
 import asyncio
 import logging
-import io
+import threading
 try:
-    from PIL import Image
     import pillow_heif
     # Register HEIF opener with PIL
     pillow_heif.register_heif_opener()
@@ -20,8 +18,20 @@ try:
 except ImportError:
     PILLOW_AVAILABLE = False
 
+from src.utils.async_helpers import decorrelated_jitter
+from src.utils.image_converter import convert_heic_to_jpeg, sniff_image_format
+from src.utils.json_utils import json_loads
+
 logger = logging.getLogger(__name__)
 
+# Generation settings are the same for every request, so they are built once
+_EXTRACTION_CONFIG = GenerateContentConfig(
+    max_output_tokens=4096,  # Increased for complex recipes with many ingredients/steps
+    temperature=0.1,
+    top_p=0.8,
+    response_mime_type="application/json",  # Force JSON response
+)
+
 # Emoji mapping for common cooking ingredients (hybrid approach)
 # AI will use this mapping first, fall back to generating emoji if ingredient not found
 INGREDIENT_EMOJI_MAP = {
@@ -238,7 +248,7 @@ class GenAIServicePool:
             service = self.services[self.current_index]
             self.current_index = (self.current_index + 1) % len(self.services)
 
-            logger.debug(f"Using GenAI service: {service.service_id}")
+            logger.debug("Using GenAI service: %s", service.service_id)
             return service
 
     def get_pool_size(self) -> int:
@@ -284,11 +294,16 @@ class GenAIService:
         self.last_request_time = 0
         self.min_request_interval = 0.2  # 200ms between requests per service
 
-    def _retry_with_backoff(self, func, max_retries=3, base_delay=1):
-        """Retry function with exponential backoff for 429 errors"""
+    async def _retry_with_backoff(self, func, max_retries=3, base_delay=1):
+        """Retry function with exponential backoff for 429 errors
+
+        The Gen AI SDK call is blocking, so it runs in a worker thread to keep
+        the event loop free for other requests.
+        """
+        delay = base_delay
         for attempt in range(max_retries):
             try:
-                return func()
+                return await asyncio.to_thread(func)
             except Exception as e:
                 error_str = str(e)
                 if "429" in error_str or "RESOURCE_EXHAUSTED" in error_str:
@@ -298,13 +313,13 @@ class GenAIService:
                         )
                         raise e
 
-                    # Exponential backoff with jitter
-                    delay = base_delay * (2**attempt) + random.uniform(0, 1)
+                    # Decorrelated jitter so concurrent jobs don't retry in lockstep
+                    delay = decorrelated_jitter(delay, base_delay)
                     logger.warning(
                         f"Service {self.service_id} - Got 429 error, retrying in {delay:.2f}s "
                         f"(attempt {attempt + 1}/{max_retries})"
                     )
-                    time.sleep(delay)
+                    await asyncio.sleep(delay)
                 else:
                     # Non-429 error, don't retry
                     raise e
@@ -312,13 +327,13 @@ class GenAIService:
 
     async def _rate_limit(self):
         """Ensure minimum time between requests for this service"""
-        current_time = time.time()
+        current_time = time.monotonic()
         time_since_last_request = current_time - self.last_request_time
         if time_since_last_request < self.min_request_interval:
             sleep_time = self.min_request_interval - time_since_last_request
-            logger.debug(f"Service {self.service_id} - Rate limiting: waiting {sleep_time:.2f}s")
+            logger.debug("Service %s - Rate limiting: waiting %.2fs", self.service_id, sleep_time)
             await asyncio.sleep(sleep_time)
-        self.last_request_time = time.time()
+        self.last_request_time = time.monotonic()
 
     async def analyze_video_with_transcript(
         self,
@@ -493,21 +508,16 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
             return self.client.models.generate_content(
                 model=self.model,
                 contents=contents,
-                config=GenerateContentConfig(
-                    max_output_tokens=4096,  # Increased for complex recipes with many ingredients/steps
-                    temperature=0.1,
-                    top_p=0.8,
-                    response_mime_type="application/json",
-                ),
+                config=_EXTRACTION_CONFIG,
             )
 
         logger.info(f"Service {self.service_id} - Analyzing video")
-        response = self._retry_with_backoff(make_request, max_retries=5, base_delay=2)
+        response = await self._retry_with_backoff(make_request, max_retries=5, base_delay=2)
 
         # Parse response
         try:
             response_text = response.text.strip()
-            logger.debug(f"Service {self.service_id} - Raw response: {response_text[:500]}...")
+            logger.debug("Service %s - Raw response: %s...", self.service_id, response_text[:500])
 
             # Clean up response if needed
             if "```json" in response_text:
@@ -519,8 +529,12 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                 json_end = response_text.find("```", json_start)
                 response_text = response_text[json_start:json_end].strip()
 
-            parsed_json = json.loads(response_text)
-            logger.debug(f"Service {self.service_id} - Gemini returned image field: {parsed_json.get('image', 'NOT_SET')}")
+            parsed_json = json_loads(response_text)
+            logger.debug(
+                "Service %s - Gemini returned image field: %s",
+                self.service_id,
+                parsed_json.get("image", "NOT_SET"),
+            )
 
             # Apply emoji mapping to ingredients (hybrid approach)
             parsed_json = self._apply_emoji_mapping(parsed_json)
@@ -529,7 +543,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
         except Exception as e:
             logger.error(f"Service {self.service_id} - Failed to parse response: {e}")
             try:
-                logger.error(f"Service {self.service_id} - Full response object: {response}")
+                logger.error("Service %s - Full response object: %s", self.service_id, response)
             except Exception:
                 logger.error(f"Service {self.service_id} - Could not access response object")
             return None
@@ -705,8 +719,6 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
         contents = [prompt]
 
         # Add all slideshow images to the analysis (convert to JPEG if needed)
-        from src.utils.image_converter import convert_image_to_jpeg
-
         valid_images = 0
         for i, image_content in enumerate(slideshow_images):
             if image_content and len(image_content) > 0:  # Skip empty image content
@@ -722,7 +734,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                                 try:
                                     image_content = self._convert_heic_to_jpeg(image_content)
                                     mime_type = "image/jpeg"
-                                    logger.debug(f"Service {self.service_id} - Converted HEIC image {i} to JPEG for Gemini compatibility")
+                                    logger.debug("Service %s - Converted HEIC image %s to JPEG for Gemini compatibility", self.service_id, i)
                                 except Exception as conv_error:
                                     logger.warning(f"Service {self.service_id} - Failed to convert HEIC image {i} to JPEG: {conv_error}, skipping")
                                     continue
@@ -732,7 +744,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                             
                         contents.append(Part.from_bytes(data=image_content, mime_type=mime_type))
                         valid_images += 1
-                        logger.debug(f"Service {self.service_id} - Added image {i} to analysis (size: {len(image_content)} bytes, type: {mime_type})")
+                        logger.debug("Service %s - Added image %s to analysis (size: %s bytes, type: %s)", self.service_id, i, len(image_content), mime_type)
                     except Exception as e:
                         logger.warning(
                             f"Service {self.service_id} - Failed to add image {i} to analysis: {e}"
@@ -749,22 +761,17 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
             return self.client.models.generate_content(
                 model=self.model,
                 contents=contents,
-                config=GenerateContentConfig(
-                    max_output_tokens=4096,  # Increased for complex recipes with many ingredients/steps
-                    temperature=0.1,
-                    top_p=0.8,
-                    response_mime_type="application/json",
-                ),
+                config=_EXTRACTION_CONFIG,
             )
 
         logger.info(f"Service {self.service_id} - Analyzing slideshow with {valid_images} images")
-        response = self._retry_with_backoff(make_request, max_retries=5, base_delay=2)
+        response = await self._retry_with_backoff(make_request, max_retries=5, base_delay=2)
 
         # Parse response
         try:
             response_text = response.text.strip()
             logger.debug(
-                f"Service {self.service_id} - Raw slideshow response: {response_text[:500]}..."
+                "Service %s - Raw slideshow response: %s...", self.service_id, response_text[:500]
             )
 
             # Clean up response if needed
@@ -777,9 +784,11 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                 json_end = response_text.find("```", json_start)
                 response_text = response_text[json_start:json_end].strip()
 
-            parsed_json = json.loads(response_text)
+            parsed_json = json_loads(response_text)
             logger.debug(
-                f"Service {self.service_id} - Gemini slideshow returned image field: {parsed_json.get('image', 'NOT_SET')}"
+                "Service %s - Gemini slideshow returned image field: %s",
+                self.service_id,
+                parsed_json.get("image", "NOT_SET"),
             )
 
             # Apply emoji mapping to ingredients (hybrid approach)
@@ -815,7 +824,7 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
                 mapped_emoji = INGREDIENT_EMOJI_MAP.get(ingredient_name)
                 if mapped_emoji:
                     ingredient["emoji"] = mapped_emoji
-                    logger.debug(f"Service {self.service_id} - Applied predefined emoji '{mapped_emoji}' to '{ingredient_name}'")
+                    logger.debug("Service %s - Applied predefined emoji '%s' to '%s'", self.service_id, mapped_emoji, ingredient_name)
 
         return recipe_data
 
@@ -823,66 +832,14 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
         """Validate if the content is a valid image by checking headers"""
         if not content or len(content) < 10:
             return False
-            
-        # Check for common image format headers
-        # JPEG
-        if content.startswith(b'\xff\xd8\xff'):
-            return True
-        # PNG
-        if content.startswith(b'\x89PNG\r\n\x1a\n'):
-            return True
-        # WebP
-        if len(content) > 12 and content[8:12] == b'WEBP':
-            return True
-        # GIF
-        if content.startswith(b'GIF87a') or content.startswith(b'GIF89a'):
-            return True
-        # BMP
-        if content.startswith(b'BM'):
-            return True
-        # HEIC/HEIF (Apple's format used by TikTok)
-        if len(content) > 12:
-            # HEIC files have 'ftyp' at offset 4-8 and 'heic' or 'mif1' at offset 8-12
-            if content[4:8] == b'ftyp' and (content[8:12] == b'heic' or content[8:12] == b'mif1'):
-                return True
-            # Alternative HEIC signature
-            if content[4:8] == b'ftyp' and content[8:12] == b'heix':
-                return True
-            # Additional HEIC variants
-            if content[4:8] == b'ftyp' and content[8:12] == b'msf1':
-                return True
-            # Check for any MP4-based image format (which HEIC is based on)
-            if content[4:8] == b'ftyp':
-                return True
-        
-        # AVIF format (another modern image format)
-        if len(content) > 12 and content[4:8] == b'ftyp' and content[8:12] == b'avif':
-            return True
-            
-        return False
+        # One pass over the known magic numbers (JPEG, PNG, WebP, GIF, BMP, HEIC/AVIF)
+        return sniff_image_format(content) is not None
 
     def _get_image_mime_type(self, content: bytes) -> str:
         """Determine the MIME type of an image based on its content"""
-        if content.startswith(b'\xff\xd8\xff'):
-            return "image/jpeg"
-        elif content.startswith(b'\x89PNG\r\n\x1a\n'):
-            return "image/png"
-        elif len(content) > 12 and content[8:12] == b'WEBP':
-            return "image/webp"
-        elif content.startswith(b'GIF87a') or content.startswith(b'GIF89a'):
-            return "image/gif"
-        elif content.startswith(b'BM'):
-            return "image/bmp"
-        elif len(content) > 12 and content[4:8] == b'ftyp':
-            # Handle all MP4-based image formats (HEIC, AVIF, etc.)
-            if content[8:12] == b'avif':
-                return "image/avif"
-            else:
-                # Default to HEIC for other ftyp-based formats
-                return "image/heic"
-        else:
-            # Default to JPEG if we can't determine the type
-            return "image/jpeg"
+        image_format = sniff_image_format(content)
+        # Default to JPEG if we can't determine the type
+        return f"image/{image_format}" if image_format else "image/jpeg"
 
     def _convert_heic_to_jpeg(self, heic_content: bytes) -> bytes:
         """Convert HEIC image content to JPEG format"""
@@ -890,21 +847,33 @@ IMPORTANT: Your response must be ONLY the JSON object, with no markdown formatti
             raise RuntimeError("Pillow and pillow-heif are required for HEIC conversion")
         
         try:
-            # Open HEIC image from bytes
-            heic_image = Image.open(io.BytesIO(heic_content))
-            
-            # Convert to RGB if necessary (HEIC can be in different color modes)
-            if heic_image.mode != 'RGB':
-                heic_image = heic_image.convert('RGB')
-            
-            # Save as JPEG to bytes buffer
-            jpeg_buffer = io.BytesIO()
-            heic_image.save(jpeg_buffer, format='JPEG', quality=85, optimize=True)
-            jpeg_content = jpeg_buffer.getvalue()
+            jpeg_content = convert_heic_to_jpeg(heic_content)
             
-            logger.debug(f"Service {self.service_id} - Converted HEIC image ({len(heic_content)} bytes) to JPEG ({len(jpeg_content)} bytes)")
+            logger.debug("Service %s - Converted HEIC image (%s bytes) to JPEG (%s bytes)", self.service_id, len(heic_content), len(jpeg_content))
             return jpeg_content
             
         except Exception as e:
             logger.error(f"Service {self.service_id} - Failed to convert HEIC to JPEG: {e}")
             raise
+
+
+_shared_pool: Optional[GenAIServicePool] = None
+_shared_pool_lock = threading.Lock()
+
+
+def get_genai_service_pool() -> GenAIServicePool:
+    """
+    Get the process-wide GenAI service pool, creating it on first use.
+
+    Building the pool loads credentials and constructs one genai.Client per
+    account/location, so it is shared rather than rebuilt per caller.
+    Construction errors propagate and nothing is cached.
+    """
+    global _shared_pool
+    if _shared_pool is not None:
+        return _shared_pool
+
+    with _shared_pool_lock:
+        if _shared_pool is None:
+            _shared_pool = GenAIServicePool()
+        return _shared_pool
@@ -4,10 +4,11 @@ import asyncio
 from typing import Dict, Any, Optional, Tuple, List
 import os
 from urllib.parse import urlparse
-import re
 from dataclasses import dataclass
 
-from src.models.parser_result import VideoMetadata, SlideshowImage
+from src.models.parser_result import HASHTAG_RE, VideoMetadata, SlideshowImage
+from src.services.url_router import INSTAGRAM_DOMAINS, INSTAGRAM_PATH_RE
+from src.utils.async_helpers import gather_with_concurrency
 
 
 """
@@ -36,6 +37,9 @@ API Endpoints Used:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of slideshow images downloaded in parallel
+MAX_CONCURRENT_IMAGE_DOWNLOADS = 8
+
 
 class InstagramScraperError(Exception):
     """Base exception for Instagram scraper errors"""
@@ -122,26 +126,14 @@ class InstagramScraper:
             raise ValidationError(f"Invalid URL format: {e}")
 
         # Check if it's an Instagram URL
-        valid_domains = [
-            "instagram.com",
-            "www.instagram.com",
-            "instagr.am",
-            "www.instagr.am",
-        ]
-        if parsed.netloc.lower() not in valid_domains:
+        if parsed.netloc.lower() not in INSTAGRAM_DOMAINS:
             raise ValidationError(
                 f"URL domain '{parsed.netloc}' is not a recognized Instagram domain"
             )
 
         # Check if it's a valid Instagram post/reel URL pattern
         path = parsed.path
-        valid_patterns = [
-            r"^/p/[A-Za-z0-9_-]+/?$",  # Post URL
-            r"^/reel/[A-Za-z0-9_-]+/?$",  # Reel URL
-            r"^/reels?/[A-Za-z0-9_-]+/?$",  # Alternative reel URL
-        ]
-
-        if not any(re.match(pattern, path) for pattern in valid_patterns):
+        if not INSTAGRAM_PATH_RE.match(path):
             logger.warning(f"URL path '{path}' doesn't match expected Instagram post/reel patterns")
 
         return url
@@ -399,7 +391,7 @@ class InstagramScraper:
             caption = caption_edges[0].get("node", {}).get("text", "")
 
         # Extract hashtags from caption
-        hashtags = re.findall(r"#\w+", caption) if caption else []
+        hashtags = HASHTAG_RE.findall(caption) if caption else []
 
         # Owner info
         owner = media_data.get("owner", {})
@@ -559,6 +551,35 @@ class InstagramScraper:
             
         return False
 
+    async def _download_slideshow_image(
+        self,
+        client: httpx.AsyncClient,
+        img: SlideshowImage,
+        headers: Dict[str, str],
+        total: int,
+    ) -> Optional[bytes]:
+        """Download a single slideshow image, returning None if it fails or is not an image"""
+        try:
+            response = await client.get(img.url, headers=headers)
+            response.raise_for_status()
+            
+            # Validate that the content is actually an image
+            content = response.content
+            if self._is_valid_image(content):
+                logger.info(
+                    f"Downloaded Instagram slideshow image {img.index + 1}/{total}"
+                )
+                return content
+
+            # Debug: Log the first 20 bytes to understand the format
+            content_hex = content[:20].hex() if len(content) >= 20 else content.hex()
+            logger.warning(f"Downloaded content for Instagram image {img.index} is not a valid image, skipping. Size: {len(content)} bytes, First 20 bytes: {content_hex}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to download Instagram slideshow image {img.index}: {e}")
+            return None
+
     async def download_slideshow_images(self, api_data: Dict[str, Any]) -> List[bytes]:
         """Download all images from a slideshow - same pattern as TikTok"""
         slideshow_images = self.get_slideshow_images(api_data)
@@ -568,29 +589,18 @@ class InstagramScraper:
             "Referer": "https://www.instagram.com/",
         }
 
-        image_contents = []
-
+        # Download images concurrently; results keep slideshow order
         async with httpx.AsyncClient(timeout=60) as client:
-            for img in slideshow_images:
-                try:
-                    response = await client.get(img.url, headers=headers)
-                    response.raise_for_status()
-                    
-                    # Validate that the content is actually an image
-                    content = response.content
-                    if self._is_valid_image(content):
-                        image_contents.append(content)
-                        logger.info(
-                            f"Downloaded Instagram slideshow image {img.index + 1}/{len(slideshow_images)}"
-                        )
-                    else:
-                        # Debug: Log the first 20 bytes to understand the format - same as TikTok
-                        content_hex = content[:20].hex() if len(content) >= 20 else content.hex()
-                        logger.warning(f"Downloaded content for Instagram image {img.index} is not a valid image, skipping. Size: {len(content)} bytes, First 20 bytes: {content_hex}")
-                        
-                except Exception as e:
-                    logger.error(f"Failed to download Instagram slideshow image {img.index}: {e}")
-                    # Don't add empty bytes or invalid content - just skip
+            results = await gather_with_concurrency(
+                MAX_CONCURRENT_IMAGE_DOWNLOADS,
+                *[
+                    self._download_slideshow_image(client, img, headers, len(slideshow_images))
+                    for img in slideshow_images
+                ],
+            )
+
+        # Don't add empty bytes or invalid content - just skip
+        image_contents = [content for content in results if content is not None]
 
         logger.info(
             f"Downloaded {len(image_contents)} valid images out of {len(slideshow_images)} Instagram slideshow images"
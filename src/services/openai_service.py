@@ -9,6 +9,8 @@ import asyncio
 import json
 from typing import Optional, Dict, Any
 
+from src.utils.json_utils import json_loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -55,7 +57,7 @@ Respond with ONLY the templatized script, no additional text or explanation."""
 
         try:
             # Run synchronous OpenAI call in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: self.client.chat.completions.create(
@@ -195,7 +197,7 @@ CRITICAL RULES:
 
         try:
             # Run synchronous OpenAI call in executor to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: self.client.chat.completions.create(
@@ -208,9 +210,9 @@ CRITICAL RULES:
             )
 
             response_text = response.choices[0].message.content.strip()
-            logger.debug(f"Raw script generation response: {response_text[:500]}...")
+            logger.debug("Raw script generation response: %s...", response_text[:500])
 
-            parsed_json = json.loads(response_text)
+            parsed_json = json_loads(response_text)
             logger.info(f"Successfully generated script with OpenAI")
             return parsed_json
 
@@ -383,7 +385,7 @@ Respond with JSON only:
 }}"""
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: self.client.chat.completions.create(
@@ -396,9 +398,9 @@ Respond with JSON only:
             )
 
             response_text = response.choices[0].message.content.strip()
-            logger.debug(f"Raw from-scratch response: {response_text[:500]}...")
+            logger.debug("Raw from-scratch response: %s...", response_text[:500])
 
-            parsed = json.loads(response_text)
+            parsed = json_loads(response_text)
             
             # Post-process to add full_text, word_count, estimated_seconds
             for option in parsed.get("options", []):
@@ -496,7 +498,7 @@ Return ONLY the refined text as a JSON object:
 }}"""
 
         try:
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             response = await loop.run_in_executor(
                 None,
                 lambda: self.client.chat.completions.create(
@@ -509,7 +511,7 @@ Return ONLY the refined text as a JSON object:
             )
 
             response_text = response.choices[0].message.content.strip()
-            parsed = json.loads(response_text)
+            parsed = json_loads(response_text)
             
             refined_text = parsed.get("refined_text", "")
             word_count = self.count_words(refined_text)
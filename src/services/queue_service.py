@@ -2,6 +2,7 @@ from google.cloud import firestore
 from google.cloud.firestore import FieldFilter
 from google.api_core import retry
 from google.api_core import exceptions
+import json
 import logging
 import os
 import warnings
@@ -11,6 +12,8 @@ import time
 import asyncio
 from dotenv import load_dotenv
 
+from src.services.firestore_client import get_firestore_client
+
 # Load environment variables
 load_dotenv()
 
@@ -55,7 +58,7 @@ class QueueService:
         for attempt in range(max_attempts):
             try:
                 # Initialize Firestore client with timeout
-                self.db = firestore.Client(project=self.project_id)
+                self.db = get_firestore_client(self.project_id)
                 self.queue_collection = self.db.collection("processing_queue")
                 self.results_collection = self.db.collection("processing_results")
                 self.dead_letter_collection = self.db.collection("processing_dead_letter")
@@ -136,8 +139,21 @@ class QueueService:
             logger.error(f"Error enqueuing video job: {e}")
             raise Exception(f"Failed to enqueue job: {e}")
 
-    async def get_job_by_url(self, url: str, status: Optional[str] = None, localization: Optional[str] = None) -> Optional[Dict]:
-        """Check if URL+localization combo is already in queue with optional status filter"""
+    async def get_job_by_url(
+        self,
+        url: str,
+        status: Optional[str] = None,
+        localization: Optional[str] = None,
+        statuses: Optional[List[str]] = None,
+    ) -> Optional[Dict]:
+        """Check if URL+localization combo is already in queue with optional status filter
+
+        Pass statuses to match any of several statuses in a single query.
+        status and statuses are mutually exclusive.
+        """
+        if status and statuses:
+            raise ValueError("Pass either status or statuses, not both")
+
         if not self.db:
             return None
 
@@ -153,6 +169,8 @@ class QueueService:
 
             if status:
                 query = query.where(filter=FieldFilter("status", "==", status))
+            elif statuses:
+                query = query.where(filter=FieldFilter("status", "in", statuses))
 
             # Get most recent job for this URL+localization combo
             query = query.order_by("created_at", direction=firestore.Query.DESCENDING).limit(1)
@@ -195,7 +213,7 @@ class QueueService:
                 except Exception as index_error:
                     # Fallback to simple query if composite index not ready
                     if "index" in str(index_error).lower():
-                        logger.debug(f"Composite index not ready, using fallback query: {index_error}")
+                        logger.debug("Composite index not ready, using fallback query: %s", index_error)
                         query = (
                             self.queue_collection.where(filter=FieldFilter("status", "==", "pending"))
                             .order_by("created_at")  # Simple query - just oldest first
@@ -217,7 +235,7 @@ class QueueService:
                     # Check if job is ready to retry (respect retry delays)
                     retry_after = job_data.get("retry_after")
                     if retry_after and current_time < retry_after:
-                        logger.debug(f"Job {job_id} not ready for retry until {retry_after}")
+                        logger.debug("Job %s not ready for retry until %s", job_id, retry_after)
                         continue
                     
                     # Use atomic transaction to prevent race conditions
@@ -263,7 +281,7 @@ class QueueService:
                             
                     except Exception as e:
                         # Transaction failed (likely another worker claimed it)
-                        logger.debug(f"Failed to claim job {job_id}: {e}")
+                        logger.debug("Failed to claim job %s: %s", job_id, e)
                         continue
 
                 # If we get here, all jobs were already claimed
@@ -284,24 +302,23 @@ class QueueService:
             return
 
         try:
-            # Store result with timeout and retry
-            self.results_collection.document(job_id).set(
+            # Store the result and update queue status in one commit
+            completed_at = datetime.now(timezone.utc)
+            batch = self.db.batch()
+            batch.set(
+                self.results_collection.document(job_id),
                 {
                     "job_id": job_id,
                     "result": result,
-                    "completed_at": datetime.now(timezone.utc),
+                    "completed_at": completed_at,
                     "status": "completed",
                 },
-                timeout=self.operation_timeout,
-                retry=self.retry_policy
             )
-
-            # Update queue status with timeout and retry
-            self.queue_collection.document(job_id).update(
-                {"status": "completed", "completed_at": datetime.now(timezone.utc)},
-                timeout=self.operation_timeout,
-                retry=self.retry_policy
+            batch.update(
+                self.queue_collection.document(job_id),
+                {"status": "completed", "completed_at": completed_at},
             )
+            batch.commit(timeout=self.operation_timeout, retry=self.retry_policy)
 
             logger.info(f"Job {job_id} marked as complete and removed from queue")
 
@@ -332,7 +349,6 @@ class QueueService:
                 # Sanitize error message to ensure it's serializable
                 try:
                     # Try to serialize the error to catch any non-serializable objects
-                    import json
                     json.dumps(error)
                     sanitized_error = error
                 except (TypeError, ValueError):
@@ -356,15 +372,11 @@ class QueueService:
                         "original_job_id": job_id,
                     }
                     
-                    # Add to dead letter queue with timeout and retry
-                    self.dead_letter_collection.document(job_id).set(
-                        dead_letter_data,
-                        timeout=self.operation_timeout,
-                        retry=self.retry_policy
-                    )
-                    
-                    # Remove from main queue with timeout and retry
-                    job_ref.delete(timeout=self.operation_timeout, retry=self.retry_policy)
+                    # Add to dead letter queue and remove from main queue in one commit
+                    batch = self.db.batch()
+                    batch.set(self.dead_letter_collection.document(job_id), dead_letter_data)
+                    batch.delete(job_ref)
+                    batch.commit(timeout=self.operation_timeout, retry=self.retry_policy)
                     
                     logger.error(f"Job {job_id} moved to dead letter queue after {attempts} attempts: {error}")
                 else:
@@ -532,7 +544,7 @@ class QueueService:
                 deleted_in_batch = len(docs)
                 total_deleted += deleted_in_batch
                 
-                logger.debug(f"Cleaned up batch of {deleted_in_batch} jobs")
+                logger.debug("Cleaned up batch of %s jobs", deleted_in_batch)
 
                 # If we got fewer docs than requested, we're done
                 if deleted_in_batch < batch_size:
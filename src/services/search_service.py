@@ -27,6 +27,8 @@ from typing import Optional, Dict, Any, List
 from abc import ABC, abstractmethod
 from dotenv import load_dotenv
 
+from src.services.video_service import VIDEO_LIST_FIELDS
+
 # Load environment variables
 load_dotenv()
 
@@ -148,7 +150,7 @@ class AlgoliaBackend(SearchBackend):
             }
             
             self.index.save_object(record)
-            logger.debug(f"Indexed video {video_id} in Algolia")
+            logger.debug("Indexed video %s in Algolia", video_id)
             return True
             
         except Exception as e:
@@ -161,7 +163,7 @@ class AlgoliaBackend(SearchBackend):
         
         try:
             self.index.delete_object(video_id)
-            logger.debug(f"Deleted video {video_id} from Algolia")
+            logger.debug("Deleted video %s from Algolia", video_id)
             return True
         except Exception as e:
             logger.error(f"Failed to delete video {video_id} from Algolia: {e}")
@@ -309,7 +311,7 @@ class TypesenseBackend(SearchBackend):
             }
             
             self.client.collections[self.collection_name].documents.upsert(document)
-            logger.debug(f"Indexed video {video_id} in Typesense")
+            logger.debug("Indexed video %s in Typesense", video_id)
             return True
             
         except Exception as e:
@@ -322,7 +324,7 @@ class TypesenseBackend(SearchBackend):
         
         try:
             self.client.collections[self.collection_name].documents[video_id].delete()
-            logger.debug(f"Deleted video {video_id} from Typesense")
+            logger.debug("Deleted video %s from Typesense", video_id)
             return True
         except Exception as e:
             logger.error(f"Failed to delete video {video_id} from Typesense: {e}")
@@ -434,6 +436,7 @@ class FirestoreBackend(SearchBackend):
                 docs = (
                     self.video_service.videos_collection
                     .order_by("save_count", direction="DESCENDING")
+                    .select(VIDEO_LIST_FIELDS)
                     .limit(limit)
                     .offset(offset)
                     .stream()
@@ -4,11 +4,12 @@ import asyncio
 from typing import Dict, Any, Optional, Tuple, List
 import os
 from urllib.parse import urlparse
-import re
 from dataclasses import dataclass
 
 
-from src.models.parser_result import VideoMetadata, SlideshowImage
+from src.models.parser_result import HASHTAG_RE, VideoMetadata, SlideshowImage
+from src.services.url_router import TIKTOK_DOMAINS
+from src.utils.async_helpers import gather_with_concurrency
 
 
 """
@@ -69,6 +70,9 @@ API Endpoints Used:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Maximum number of slideshow images downloaded in parallel
+MAX_CONCURRENT_IMAGE_DOWNLOADS = 8
+
 
 class TikTokScraperError(Exception):
     """Base exception for TikTok scraper errors"""
@@ -153,13 +157,7 @@ class TikTokScraper:
             raise ValidationError(f"Invalid URL format: {e}")
 
         # Check if it's a TikTok URL
-        valid_domains = [
-            "tiktok.com",
-            "www.tiktok.com",
-            "vm.tiktok.com",
-            "m.tiktok.com",
-        ]
-        if parsed.netloc.lower() not in valid_domains:
+        if parsed.netloc.lower() not in TIKTOK_DOMAINS:
             logger.warning(f"URL domain '{parsed.netloc}' is not a recognized TikTok domain")
 
         return url
@@ -592,7 +590,7 @@ class TikTokScraper:
         description = aweme.get("desc", "") or ""
 
         # Extract hashtags
-        hashtags = re.findall(r"#\w+", description)
+        hashtags = HASHTAG_RE.findall(description)
 
         # Check if this is a slideshow (image post)
         # NOTE: ScrapeCreators API returns image_post_info even for regular videos,
@@ -780,6 +778,35 @@ class TikTokScraper:
             response.raise_for_status()
             return response.content
 
+    async def _download_slideshow_image(
+        self,
+        client: httpx.AsyncClient,
+        img: SlideshowImage,
+        headers: Dict[str, str],
+        total: int,
+    ) -> Optional[bytes]:
+        """Download a single slideshow image, returning None if it fails or is not an image"""
+        try:
+            response = await client.get(img.url, headers=headers)
+            response.raise_for_status()
+            
+            # Validate that the content is actually an image
+            content = response.content
+            if self._is_valid_image(content):
+                logger.info(
+                    f"Downloaded slideshow image {img.index + 1}/{total}"
+                )
+                return content
+
+            # Debug: Log the first 20 bytes to understand the format
+            content_hex = content[:20].hex() if len(content) >= 20 else content.hex()
+            logger.warning(f"Downloaded content for image {img.index} is not a valid image, skipping. Size: {len(content)} bytes, First 20 bytes: {content_hex}")
+            return None
+
+        except Exception as e:
+            logger.error(f"Failed to download slideshow image {img.index}: {e}")
+            return None
+
     async def download_slideshow_images(self, api_data: Dict[str, Any]) -> List[bytes]:
         """Download all images from a slideshow"""
         slideshow_images = self.get_slideshow_images(api_data)
@@ -789,29 +816,18 @@ class TikTokScraper:
             "Referer": "https://www.tiktok.com/",
         }
 
-        image_contents = []
-
+        # Download images concurrently; results keep slideshow order
         async with httpx.AsyncClient(timeout=60) as client:
-            for img in slideshow_images:
-                try:
-                    response = await client.get(img.url, headers=headers)
-                    response.raise_for_status()
-                    
-                    # Validate that the content is actually an image
-                    content = response.content
-                    if self._is_valid_image(content):
-                        image_contents.append(content)
-                        logger.info(
-                            f"Downloaded slideshow image {img.index + 1}/{len(slideshow_images)}"
-                        )
-                    else:
-                        # Debug: Log the first 20 bytes to understand the format
-                        content_hex = content[:20].hex() if len(content) >= 20 else content.hex()
-                        logger.warning(f"Downloaded content for image {img.index} is not a valid image, skipping. Size: {len(content)} bytes, First 20 bytes: {content_hex}")
-                        
-                except Exception as e:
-                    logger.error(f"Failed to download slideshow image {img.index}: {e}")
-                    # Don't add empty bytes or invalid content - just skip
+            results = await gather_with_concurrency(
+                MAX_CONCURRENT_IMAGE_DOWNLOADS,
+                *[
+                    self._download_slideshow_image(client, img, headers, len(slideshow_images))
+                    for img in slideshow_images
+                ],
+            )
+
+        # Don't add empty bytes or invalid content - just skip
+        image_contents = [content for content in results if content is not None]
 
         logger.info(
             f"Downloaded {len(image_contents)} valid images out of {len(slideshow_images)} slideshow images"
@@ -1,6 +1,6 @@
 import re
-from urllib.parse import urlparse
-from typing import Optional
+from urllib.parse import ParseResult, urlparse
+from typing import NamedTuple, Optional
 
 try:
     from typing import Literal
@@ -10,6 +10,47 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Display names for supported platforms
+_PLATFORM_DISPLAY_NAMES = {"tiktok": "TikTok", "instagram": "Instagram"}
+
+
+class ValidationResult(NamedTuple):
+    """Result of URLRouter.validate_url"""
+
+    is_valid: bool
+    error_message: Optional[str]
+    platform: Optional[str]
+
+
+# Shared results for fixed validation outcomes
+_ERR_NOT_STRING = ValidationResult(False, "URL must be a non-empty string", None)
+_ERR_EMPTY = ValidationResult(False, "URL cannot be empty", None)
+_ERR_UNSUPPORTED = ValidationResult(False, "URL must be from TikTok or Instagram", None)
+_ERR_TIKTOK_FORMAT = ValidationResult(False, "Invalid TikTok URL format", "tiktok")
+_ERR_INSTAGRAM_FORMAT = ValidationResult(
+    False, "URL must be an Instagram post or reel", "instagram"
+)
+_VALID_RESULTS = {
+    "tiktok": ValidationResult(True, None, "tiktok"),
+    "instagram": ValidationResult(True, None, "instagram"),
+}
+
+# Recognized hosts per platform, shared with the scrapers
+TIKTOK_DOMAINS = frozenset(
+    {"tiktok.com", "www.tiktok.com", "vm.tiktok.com", "m.tiktok.com", "vt.tiktok.com"}
+)
+INSTAGRAM_DOMAINS = frozenset(
+    {"instagram.com", "www.instagram.com", "instagr.am", "www.instagr.am"}
+)
+
+# Instagram post (/p/...) and reel (/reel/..., /reels/...) paths
+INSTAGRAM_PATH_RE = re.compile(r"^/(?:p|reels?)/[A-Za-z0-9_-]+/?$")
+
+
+def _normalize_url(url: str) -> str:
+    """Return the URL with an https:// scheme prepended if it has none"""
+    return url if "://" in url[:10] else "https://" + url
+
 
 class URLRouter:
     """
@@ -40,45 +81,30 @@ class URLRouter:
         if not url:
             return None
 
-        # Parse URL
+        url = _normalize_url(url)
+
+        # Parse URL (urlparse only raises ValueError, e.g. for malformed IPv6 hosts)
         try:
             parsed = urlparse(url)
-            # Add scheme if missing
-            if not parsed.scheme:
-                url = f"https://{url}"
-                parsed = urlparse(url)
-
-            domain = parsed.netloc.lower()
-
-            # TikTok domains
-            tiktok_domains = [
-                "tiktok.com",
-                "www.tiktok.com",
-                "vm.tiktok.com",
-                "m.tiktok.com",
-                "vt.tiktok.com",
-            ]
-
-            # Instagram domains
-            instagram_domains = [
-                "instagram.com",
-                "www.instagram.com",
-                "instagr.am",
-                "www.instagr.am",
-            ]
-
-            if domain in tiktok_domains:
-                logger.debug(f"URL detected as TikTok: {url}")
-                return "tiktok"
-            elif domain in instagram_domains:
-                logger.debug(f"URL detected as Instagram: {url}")
-                return "instagram"
-            else:
-                logger.warning(f"URL domain '{domain}' not recognized as TikTok or Instagram")
-                return None
-
-        except Exception as e:
-            logger.error(f"Error parsing URL '{url}': {e}")
+        except ValueError as e:
+            logger.error("Error parsing URL '%s': %s", url, e)
+            return None
+
+        return URLRouter._platform_from_parsed(parsed, url)
+
+    @staticmethod
+    def _platform_from_parsed(parsed: ParseResult, url: str) -> Optional[Platform]:
+        """Map an already-parsed, scheme-bearing URL to its platform"""
+        domain = parsed.netloc.lower()
+
+        if domain in TIKTOK_DOMAINS:
+            logger.debug("URL detected as TikTok: %s", url)
+            return "tiktok"
+        elif domain in INSTAGRAM_DOMAINS:
+            logger.debug("URL detected as Instagram: %s", url)
+            return "instagram"
+        else:
+            logger.warning("URL domain '%s' not recognized as TikTok or Instagram", domain)
             return None
 
     @staticmethod
@@ -92,7 +118,7 @@ class URLRouter:
         return URLRouter.detect_platform(url) == "instagram"
 
     @staticmethod
-    def validate_url(url: str) -> tuple:
+    def validate_url(url: str) -> ValidationResult:
         """
         Validate URL and detect platform.
 
@@ -100,56 +126,47 @@ class URLRouter:
             url: The URL to validate
 
         Returns:
-            Tuple of (is_valid, error_message, platform)
+            ValidationResult of (is_valid, error_message, platform)
         """
         if not url or not isinstance(url, str):
-            return False, "URL must be a non-empty string", None
+            return _ERR_NOT_STRING
 
         url = url.strip()
         if not url:
-            return False, "URL cannot be empty", None
+            return _ERR_EMPTY
+
+        url = _normalize_url(url)
+
+        try:
+            parsed = urlparse(url)
+        except ValueError as e:
+            logger.error("Error validating URL '%s': %s", url, e)
+            return ValidationResult(False, f"Invalid URL format: {e}", None)
 
-        platform = URLRouter.detect_platform(url)
+        platform = URLRouter._platform_from_parsed(parsed, url)
 
         if platform is None:
-            return False, "URL must be from TikTok or Instagram", None
+            return _ERR_UNSUPPORTED
 
         # Additional validation based on platform
-        try:
-            parsed = urlparse(url)
-            if not parsed.scheme:
-                url = f"https://{url}"
-                parsed = urlparse(url)
-
-            path = parsed.path
-
-            if platform == "tiktok":
-                # TikTok URL patterns
-                # Examples:
-                # https://www.tiktok.com/@username/video/1234567890
-                # https://vm.tiktok.com/XXXXXXXXX/
-                # https://m.tiktok.com/v/1234567890.html
-                if not path or path == "/":
-                    return False, "Invalid TikTok URL format", platform
-
-            elif platform == "instagram":
-                # Instagram URL patterns
-                valid_patterns = [
-                    r"^/p/[A-Za-z0-9_-]+/?$",  # Post URL
-                    r"^/reel/[A-Za-z0-9_-]+/?$",  # Reel URL
-                    r"^/reels?/[A-Za-z0-9_-]+/?$",  # Alternative reel URL
-                ]
-
-                if not any(re.match(pattern, path) for pattern in valid_patterns):
-                    return False, "URL must be an Instagram post or reel", platform
-
-            return True, None, platform
-
-        except Exception as e:
-            logger.error(f"Error validating URL '{url}': {e}")
-            return False, f"Invalid URL format: {e}", None
+        path = parsed.path
+
+        if platform == "tiktok":
+            # TikTok URL patterns
+            # Examples:
+            # https://www.tiktok.com/@username/video/1234567890
+            # https://vm.tiktok.com/XXXXXXXXX/
+            # https://m.tiktok.com/v/1234567890.html
+            if not path or path == "/":
+                return _ERR_TIKTOK_FORMAT
+
+        elif platform == "instagram":
+            if not INSTAGRAM_PATH_RE.match(path):
+                return _ERR_INSTAGRAM_FORMAT
+
+        return _VALID_RESULTS[platform]
 
     @staticmethod
     def get_platform_display_name(platform: Platform) -> str:
         """Get display name for platform"""
-        return {"tiktok": "TikTok", "instagram": "Instagram"}.get(platform, platform.title())
+        return _PLATFORM_DISPLAY_NAMES.get(platform) or platform.title()
@@ -11,25 +11,151 @@ The video_id is a hash of the normalized URL for deduplication.
 from google.cloud import firestore
 from google.api_core import retry
 from google.api_core import exceptions
+import asyncio
+import functools
 import hashlib
 import logging
 import os
-from typing import Optional, Dict, Any, List
+import string
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime, timezone
 from urllib.parse import urlparse, parse_qs, urlencode
 from dotenv import load_dotenv
 
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+from src.services.firestore_client import count_documents, get_firestore_client
+
 # Load environment variables
 load_dotenv()
 
 logger = logging.getLogger(__name__)
 
+# Video ID hashing scheme. "sha256" (default) keeps IDs compatible with
+# existing documents; "blake2b" (64-bit digest, stdlib) and "xxh3" (64-bit
+# non-cryptographic) are faster on short URLs but produce different IDs, so
+# they must only be enabled for a fresh collection or after migrating IDs.
+VIDEO_ID_SCHEME = os.getenv("VIDEO_ID_SCHEME", "sha256").lower()
+if VIDEO_ID_SCHEME == "xxh3" and not XXHASH_AVAILABLE:
+    logger.warning("VIDEO_ID_SCHEME=xxh3 requested but xxhash is not installed, using sha256")
+    VIDEO_ID_SCHEME = "sha256"
+elif VIDEO_ID_SCHEME not in ("sha256", "blake2b", "xxh3"):
+    logger.warning(f"Unknown VIDEO_ID_SCHEME={VIDEO_ID_SCHEME}, using sha256")
+    VIDEO_ID_SCHEME = "sha256"
+
+# In-memory cache of video documents read by get_video
+VIDEO_CACHE_TTL_SECONDS = 60
+MISSING_VIDEO_CACHE_TTL_SECONDS = 10
+VIDEO_CACHE_MAX_ENTRIES = 16384
+
+# Fields returned for videos joined onto a user's saved list
+VIDEO_SUMMARY_FIELDS = ["title", "niche", "format", "image", "creator", "platform", "save_count"]
+
+# Fields returned by list queries; leaves out the (large) transcript
+VIDEO_LIST_FIELDS = [
+    "url", "title", "description", "hook", "image",
+    "format", "niche", "niche_detail", "secondary_niches",
+    "creator", "platform", "hashtags",
+    "created_at", "last_saved_at", "save_count",
+]
+
+
+# Query parameters that don't affect video content
+_IGNORED_QUERY_PARAMS = frozenset({
+    "utm_source", "utm_medium", "utm_campaign",
+    "share_id", "timestamp", "ref", "source",
+})
+
+# Characters that parse_qs + urlencode pass through unchanged
+_QUERY_SAFE_CHARS = frozenset(string.ascii_letters + string.digits + "_.-~")
+
+
+def _filter_query(query: str) -> str:
+    """
+    Drop ignored parameters from a raw query string.
+
+    Plain "key=value" pairs (unique keys, non-empty values, no characters that
+    need escaping) are filtered in a single pass over the string. Anything else
+    goes through parse_qs/urlencode; both paths produce the same output, which
+    keeps video IDs stable.
+    """
+    kept = []
+    seen = set()
+    for pair in query.split("&"):
+        key, sep, value = pair.partition("=")
+        if (
+            not sep
+            or not key
+            or not value
+            or key in seen
+            or not _QUERY_SAFE_CHARS.issuperset(key)
+            or not _QUERY_SAFE_CHARS.issuperset(value)
+        ):
+            break
+        seen.add(key)
+        if key not in _IGNORED_QUERY_PARAMS:
+            kept.append(pair)
+    else:
+        return "&".join(kept)
+
+    query_params = parse_qs(query)
+    filtered_params = {k: v for k, v in query_params.items() if k not in _IGNORED_QUERY_PARAMS}
+    return urlencode(filtered_params, doseq=True) if filtered_params else ""
+
+
+@functools.lru_cache(maxsize=8192)
+def _normalize_video_url(url: str) -> str:
+    """
+    Normalize video URL to ensure consistent identification.
+    Removes tracking parameters and normalizes domain.
+
+    Pure function of the URL string, so results are memoized.
+    """
+    try:
+        parsed = urlparse(url.strip())
+        normalized_query = _filter_query(parsed.query) if parsed.query else ""
+
+        # Normalize domain
+        domain = parsed.netloc.lower()
+        if domain.startswith("www."):
+            domain = domain[4:]
+
+        # Build normalized URL
+        normalized = f"{domain}{parsed.path}"
+        if normalized_query:
+            normalized += f"?{normalized_query}"
+
+        return normalized.rstrip("/")
+
+    except Exception as e:
+        logger.warning(f"Failed to normalize URL {url}: {e}")
+        return url.strip().lower()
+
+
+@functools.lru_cache(maxsize=8192)
+def _video_id_from_normalized_url(normalized_url: str) -> str:
+    """Generate a unique video ID from an already-normalized URL."""
+    if VIDEO_ID_SCHEME == "xxh3":
+        return xxhash.xxh3_64_hexdigest(normalized_url.encode())
+    if VIDEO_ID_SCHEME == "blake2b":
+        return hashlib.blake2b(normalized_url.encode(), digest_size=8).hexdigest()
+    # First 8 bytes of the digest, same as hexdigest()[:16] without hex-encoding all 32
+    return hashlib.sha256(normalized_url.encode()).digest()[:8].hex()
+
 
 class VideoService:
     """Service for managing videos and user-specific video data in Firestore."""
 
     def __init__(self):
         """Initialize Firestore video service."""
+        # video_id -> (document or None if missing, cached_at monotonic time)
+        self._video_cache: Dict[str, Tuple[Optional[Dict[str, Any]], float]] = {}
+
         self.project_id = os.getenv("GOOGLE_CLOUD_PROJECT_ID")
         if not self.project_id:
             logger.warning("GOOGLE_CLOUD_PROJECT_ID not set. Video service will be disabled.")
@@ -54,7 +180,7 @@ class VideoService:
         )
 
         try:
-            self.db = firestore.Client(project=self.project_id)
+            self.db = get_firestore_client(self.project_id)
             self.videos_collection = self.db.collection("videos")
             self.users_collection = self.db.collection("users")
             logger.info(f"Video service connected to Firestore in project: {self.project_id}")
@@ -67,42 +193,37 @@ class VideoService:
         Normalize video URL to ensure consistent identification.
         Removes tracking parameters and normalizes domain.
         """
-        try:
-            parsed = urlparse(url.strip())
-
-            # Parameters that don't affect video content
-            ignored_params = {
-                "utm_source", "utm_medium", "utm_campaign", 
-                "share_id", "timestamp", "ref", "source"
-            }
-
-            if parsed.query:
-                query_params = parse_qs(parsed.query)
-                filtered_params = {k: v for k, v in query_params.items() if k not in ignored_params}
-                normalized_query = urlencode(filtered_params, doseq=True) if filtered_params else ""
-            else:
-                normalized_query = ""
-
-            # Normalize domain
-            domain = parsed.netloc.lower()
-            if domain.startswith("www."):
-                domain = domain[4:]
-
-            # Build normalized URL
-            normalized = f"{domain}{parsed.path}"
-            if normalized_query:
-                normalized += f"?{normalized_query}"
-
-            return normalized.rstrip("/")
-
-        except Exception as e:
-            logger.warning(f"Failed to normalize URL {url}: {e}")
-            return url.strip().lower()
+        return _normalize_video_url(url)
 
     def _generate_video_id(self, url: str) -> str:
         """Generate a unique video ID from the normalized URL."""
-        normalized_url = self._normalize_url(url)
-        return hashlib.sha256(normalized_url.encode()).hexdigest()[:16]
+        return _video_id_from_normalized_url(_normalize_video_url(url))
+
+    def _get_cached_video(self, video_id: str) -> Tuple[bool, Optional[Dict[str, Any]]]:
+        """Return (hit, video) from the local cache, dropping expired entries."""
+        entry = self._video_cache.get(video_id)
+        if entry is None:
+            return False, None
+
+        video, cached_at = entry
+        ttl = VIDEO_CACHE_TTL_SECONDS if video is not None else MISSING_VIDEO_CACHE_TTL_SECONDS
+        if time.monotonic() - cached_at >= ttl:
+            self._video_cache.pop(video_id, None)
+            return False, None
+
+        # Hand out a copy so callers can't mutate the cached document
+        return True, dict(video) if video is not None else None
+
+    def _cache_video(self, video_id: str, video: Optional[Dict[str, Any]]):
+        """Store a video (or a miss) in the local cache, evicting the oldest entry when full."""
+        self._video_cache.pop(video_id, None)
+        if len(self._video_cache) >= VIDEO_CACHE_MAX_ENTRIES:
+            self._video_cache.pop(next(iter(self._video_cache)))
+        self._video_cache[video_id] = (video, time.monotonic())
+
+    def _invalidate_cached_video(self, video_id: str):
+        """Drop a video from the local cache after it is written."""
+        self._video_cache.pop(video_id, None)
 
     async def save_video(
         self,
@@ -132,82 +253,186 @@ class VideoService:
             logger.warning("Video service not available")
             return {"success": False, "error": "Service unavailable"}
 
-        video_id = self._generate_video_id(url)
+        normalized_url = _normalize_video_url(url)
+        video_id = _video_id_from_normalized_url(normalized_url)
         now = datetime.now(timezone.utc)
 
         try:
             video_ref = self.videos_collection.document(video_id)
-            existing_doc = video_ref.get(timeout=self.connection_timeout)
 
-            if existing_doc.exists:
-                # Update existing video - increment save count
-                video_ref.update(
-                    {
-                        "save_count": firestore.Increment(1),
-                        "last_saved_at": now,
-                    },
-                    timeout=self.operation_timeout,
-                    retry=self.retry_policy
-                )
-                logger.info(f"Updated existing video {video_id}, incremented save_count")
-            else:
-                # Create new video entry
-                video_entry = {
-                    "video_id": video_id,
-                    "url": url,
-                    "normalized_url": self._normalize_url(url),
-                    
-                    # Core content from AI extraction
-                    "title": video_data.get("title"),
-                    "description": video_data.get("description"),
-                    "transcript": video_data.get("transcript"),
-                    "hook": video_data.get("hook"),
-                    "image": video_data.get("image"),
-                    
-                    # Classification (AI-detected)
-                    "format": video_data.get("format"),
-                    "niche": video_data.get("niche"),
-                    "niche_detail": video_data.get("niche_detail"),
-                    "secondary_niches": video_data.get("secondary_niches"),
-                    
-                    # Metadata
-                    "creator": video_data.get("creator"),
-                    "platform": video_data.get("platform"),
-                    "hashtags": video_data.get("tags"),  # Original hashtags from post
-                    
-                    # Timestamps and stats
-                    "created_at": now,
-                    "last_saved_at": now,
-                    "save_count": 1,
-                }
-
-                video_ref.set(
-                    video_entry,
-                    timeout=self.operation_timeout,
-                    retry=self.retry_policy
-                )
-                logger.info(f"Created new video entry {video_id}")
-
-            # Save user-specific data if user_id provided
+            # User-specific data is written in the same commit as the video
+            user_video_ref = None
+            new_user_video_data = merged_user_video_data = None
             if user_id:
-                await self._save_user_video(
-                    user_id=user_id,
+                user_video_ref = self._user_video_ref(user_id, video_id)
+                build_user_video_data = functools.partial(
+                    self._build_user_video_data,
                     video_id=video_id,
                     user_tags=user_tags,
                     user_notes=user_notes,
                     user_collections=user_collections,
+                    now=now,
                 )
+                new_user_video_data = build_user_video_data(existing=False)
+                merged_user_video_data = build_user_video_data(existing=True)
+
+            # Create new video entry
+            video_entry = {
+                "video_id": video_id,
+                "url": url,
+                "normalized_url": normalized_url,
+                
+                # Core content from AI extraction
+                "title": video_data.get("title"),
+                "description": video_data.get("description"),
+                "transcript": video_data.get("transcript"),
+                "hook": video_data.get("hook"),
+                "image": video_data.get("image"),
+                
+                # Classification (AI-detected)
+                "format": video_data.get("format"),
+                "niche": video_data.get("niche"),
+                "niche_detail": video_data.get("niche_detail"),
+                "secondary_niches": video_data.get("secondary_niches"),
+                
+                # Metadata
+                "creator": video_data.get("creator"),
+                "platform": video_data.get("platform"),
+                "hashtags": video_data.get("tags"),  # Original hashtags from post
+                
+                # Timestamps and stats
+                "created_at": now,
+                "last_saved_at": now,
+                "save_count": 1,
+            }
+
+            # Create the video and the user's save in a single commit. The
+            # create fails with AlreadyExists when the video was saved before,
+            # which replaces the previous existence pre-read.
+            batch = self.db.batch()
+            batch.create(video_ref, video_entry)
+            if user_video_ref:
+                # A new video has no saves yet, so the user's save is new too
+                batch.set(user_video_ref, new_user_video_data)
+
+            try:
+                # Not retried: a retry after a lost response would see
+                # AlreadyExists and count this save a second time
+                batch.commit(timeout=self.operation_timeout, retry=None)
+                is_new = True
+                logger.info(f"Created new video entry {video_id}")
+            except exceptions.AlreadyExists:
+                self._commit_existing_video_save(
+                    video_ref,
+                    user_video_ref,
+                    new_user_video_data,
+                    merged_user_video_data,
+                    now,
+                )
+                is_new = False
+                logger.info(f"Updated existing video {video_id}, incremented save_count")
+
+            self._invalidate_cached_video(video_id)
+
+            if user_id:
+                logger.info(f"Saved video {video_id} for user {user_id}")
 
             return {
                 "success": True,
                 "video_id": video_id,
-                "is_new": not existing_doc.exists,
+                "is_new": is_new,
             }
 
         except Exception as e:
             logger.error(f"Error saving video {url}: {e}")
             return {"success": False, "error": str(e)}
 
+    def _user_video_ref(self, user_id: str, video_id: str):
+        """Get the document reference for users/{user_id}/saved_videos/{video_id}."""
+        return (
+            self.users_collection
+            .document(user_id)
+            .collection("saved_videos")
+            .document(video_id)
+        )
+
+    def _commit_existing_video_save(
+        self,
+        video_ref,
+        user_video_ref,
+        new_user_video_data: Optional[Dict[str, Any]],
+        merged_user_video_data: Optional[Dict[str, Any]],
+        now: datetime,
+    ):
+        """
+        Increment save_count on an existing video and write the user's save.
+
+        The user's save is created with its default fields first; if the user
+        already saved this video the commit fails with AlreadyExists and the
+        save is merged into their existing document instead.
+        """
+        increment = {
+            "save_count": firestore.Increment(1),
+            "last_saved_at": now,
+        }
+
+        if user_video_ref:
+            batch = self.db.batch()
+            batch.update(video_ref, increment)
+            batch.create(user_video_ref, new_user_video_data)
+            try:
+                # Not retried for the same reason as the video create
+                batch.commit(timeout=self.operation_timeout, retry=None)
+                return
+            except exceptions.AlreadyExists:
+                pass
+
+        batch = self.db.batch()
+        batch.update(video_ref, increment)
+        if user_video_ref:
+            batch.set(user_video_ref, merged_user_video_data, merge=True)
+        batch.commit(timeout=self.operation_timeout, retry=self.retry_policy)
+
+    def _build_user_video_data(
+        self,
+        video_id: str,
+        user_tags: Optional[List[str]],
+        user_notes: Optional[str],
+        user_collections: Optional[List[str]],
+        now: datetime,
+        existing: bool,
+    ) -> Dict[str, Any]:
+        """
+        Build the write for a user's saved video.
+
+        A new save gets every field, with empty defaults for tags, notes and
+        collections. For an existing save, tags and collections are merged
+        server-side with ArrayUnion so the write can be applied with
+        set(merge=True) without reading first.
+        """
+        if not existing:
+            return {
+                "video_id": video_id,
+                "user_tags": list(user_tags or []),
+                "user_notes": user_notes,
+                "collections": list(user_collections or []),
+                "saved_at": now,
+                "updated_at": now,
+            }
+
+        user_video_data = {
+            "video_id": video_id,
+            "updated_at": now,
+        }
+        # ArrayUnion rejects empty lists, so only merge values that were given
+        if user_tags:
+            user_video_data["user_tags"] = firestore.ArrayUnion(user_tags)
+        if user_notes:
+            user_video_data["user_notes"] = user_notes
+        if user_collections:
+            user_video_data["collections"] = firestore.ArrayUnion(user_collections)
+        return user_video_data
+
     async def _save_user_video(
         self,
         user_id: str,
@@ -226,57 +451,39 @@ class VideoService:
 
         try:
             now = datetime.now(timezone.utc)
-            user_video_ref = (
-                self.users_collection
-                .document(user_id)
-                .collection("saved_videos")
-                .document(video_id)
-            )
-
-            existing = user_video_ref.get(timeout=self.connection_timeout)
-
-            if existing.exists:
-                # Update existing user save - merge tags/collections
-                existing_data = existing.to_dict()
-                
-                update_data = {"updated_at": now}
-                
-                if user_tags:
-                    existing_tags = existing_data.get("user_tags", [])
-                    merged_tags = list(set(existing_tags + user_tags))
-                    update_data["user_tags"] = merged_tags
-                
-                if user_notes:
-                    update_data["user_notes"] = user_notes
-                
-                if user_collections:
-                    existing_collections = existing_data.get("collections", [])
-                    merged_collections = list(set(existing_collections + user_collections))
-                    update_data["collections"] = merged_collections
-
-                user_video_ref.update(
-                    update_data,
+            user_video_ref = self._user_video_ref(user_id, video_id)
+
+            try:
+                user_video_ref.create(
+                    self._build_user_video_data(
+                        video_id=video_id,
+                        user_tags=user_tags,
+                        user_notes=user_notes,
+                        user_collections=user_collections,
+                        now=now,
+                        existing=False,
+                    ),
                     timeout=self.operation_timeout,
                     retry=self.retry_policy
                 )
-                logger.info(f"Updated user {user_id} saved video {video_id}")
-            else:
-                # Create new user save
-                user_video_data = {
-                    "video_id": video_id,
-                    "user_tags": user_tags or [],
-                    "user_notes": user_notes,
-                    "collections": user_collections or [],
-                    "saved_at": now,
-                    "updated_at": now,
-                }
-
+                logger.info(f"Created user {user_id} saved video {video_id}")
+            except exceptions.AlreadyExists:
+                # The merge is idempotent, so a create retried into
+                # AlreadyExists only rewrites the same values
                 user_video_ref.set(
-                    user_video_data,
+                    self._build_user_video_data(
+                        video_id=video_id,
+                        user_tags=user_tags,
+                        user_notes=user_notes,
+                        user_collections=user_collections,
+                        now=now,
+                        existing=True,
+                    ),
+                    merge=True,
                     timeout=self.operation_timeout,
                     retry=self.retry_policy
                 )
-                logger.info(f"Created user {user_id} saved video {video_id}")
+                logger.info(f"Updated user {user_id} saved video {video_id}")
 
             return True
 
@@ -285,19 +492,24 @@ class VideoService:
             return False
 
     async def get_video(self, video_id: str) -> Optional[Dict[str, Any]]:
-        """Get a video by its ID."""
+        """Get a video by its ID, served from a short-lived local cache when possible."""
         if not self.db:
             return None
 
+        hit, video = self._get_cached_video(video_id)
+        if hit:
+            return video
+
         try:
-            doc = self.videos_collection.document(video_id).get(
+            doc = await asyncio.to_thread(
+                self.videos_collection.document(video_id).get,
                 timeout=self.connection_timeout,
-                retry=self.retry_policy
+                retry=self.retry_policy,
             )
             
-            if doc.exists:
-                return {"video_id": video_id, **doc.to_dict()}
-            return None
+            video = {"video_id": video_id, **doc.to_dict()} if doc.exists else None
+            self._cache_video(video_id, video)
+            return dict(video) if video is not None else None
 
         except Exception as e:
             logger.error(f"Error getting video {video_id}: {e}")
@@ -339,8 +551,15 @@ class VideoService:
         user_id: str,
         limit: int = 50,
         offset: int = 0,
+        include_video: bool = False,
     ) -> List[Dict[str, Any]]:
-        """Get all videos saved by a user."""
+        """
+        Get all videos saved by a user.
+
+        With include_video, each entry gets a "video" key holding a summary of
+        the global video document (None if it no longer exists). The summaries
+        for the whole page are fetched in one batched read.
+        """
         if not self.db:
             return []
 
@@ -355,12 +574,34 @@ class VideoService:
             )
 
             docs = query.stream(timeout=self.connection_timeout)
-            return [{"video_id": doc.id, **doc.to_dict()} for doc in docs]
+            saved_videos = [{"video_id": doc.id, **doc.to_dict()} for doc in docs]
+
+            if include_video and saved_videos:
+                summaries = self._get_video_summaries([v["video_id"] for v in saved_videos])
+                for saved_video in saved_videos:
+                    saved_video["video"] = summaries.get(saved_video["video_id"])
+
+            return saved_videos
 
         except Exception as e:
             logger.error(f"Error getting user saved videos: {e}")
             return []
 
+    def _get_video_summaries(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Batch-read summary fields for the given videos, keyed by video_id."""
+        refs = [self.videos_collection.document(video_id) for video_id in video_ids]
+        snapshots = self.db.get_all(
+            refs,
+            field_paths=VIDEO_SUMMARY_FIELDS,
+            timeout=self.connection_timeout,
+            retry=self.retry_policy,
+        )
+        return {
+            snapshot.id: {"video_id": snapshot.id, **snapshot.to_dict()}
+            for snapshot in snapshots
+            if snapshot.exists
+        }
+
     async def update_user_tags(
         self,
         user_id: str,
@@ -373,12 +614,7 @@ class VideoService:
             return False
 
         try:
-            user_video_ref = (
-                self.users_collection
-                .document(user_id)
-                .collection("saved_videos")
-                .document(video_id)
-            )
+            user_video_ref = self._user_video_ref(user_id, video_id)
 
             if replace:
                 user_video_ref.update(
@@ -386,17 +622,16 @@ class VideoService:
                     timeout=self.operation_timeout,
                     retry=self.retry_policy
                 )
-            else:
-                # Merge with existing tags
-                existing = user_video_ref.get(timeout=self.connection_timeout)
-                if existing.exists:
-                    existing_tags = existing.to_dict().get("user_tags", [])
-                    merged_tags = list(set(existing_tags + tags))
-                    user_video_ref.update(
-                        {"user_tags": merged_tags, "updated_at": datetime.now(timezone.utc)},
-                        timeout=self.operation_timeout,
-                        retry=self.retry_policy
-                    )
+            elif tags:
+                # Merge with existing tags server-side (ArrayUnion rejects empty lists)
+                user_video_ref.update(
+                    {
+                        "user_tags": firestore.ArrayUnion(tags),
+                        "updated_at": datetime.now(timezone.utc),
+                    },
+                    timeout=self.operation_timeout,
+                    retry=self.retry_policy
+                )
 
             return True
 
@@ -429,6 +664,7 @@ class VideoService:
                 timeout=self.operation_timeout,
                 retry=self.retry_policy
             )
+            self._invalidate_cached_video(video_id)
 
             logger.info(f"Removed video {video_id} from user {user_id}'s saved list")
             return True
@@ -441,8 +677,14 @@ class VideoService:
         self,
         format_type: str,
         limit: int = 50,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get videos filtered by format type (for basic Firestore queries)."""
+        """
+        Get videos filtered by format type (for basic Firestore queries).
+
+        Only VIDEO_LIST_FIELDS are returned unless `fields` says otherwise
+        (e.g. to include the transcript).
+        """
         if not self.db:
             return []
 
@@ -451,6 +693,7 @@ class VideoService:
                 self.videos_collection
                 .where("format", "==", format_type)
                 .order_by("save_count", direction=firestore.Query.DESCENDING)
+                .select(fields or VIDEO_LIST_FIELDS)
                 .limit(limit)
             )
 
@@ -465,8 +708,14 @@ class VideoService:
         self,
         niche: str,
         limit: int = 50,
+        fields: Optional[List[str]] = None,
     ) -> List[Dict[str, Any]]:
-        """Get videos filtered by niche (for basic Firestore queries)."""
+        """
+        Get videos filtered by niche (for basic Firestore queries).
+
+        Only VIDEO_LIST_FIELDS are returned unless `fields` says otherwise
+        (e.g. to include the transcript).
+        """
         if not self.db:
             return []
 
@@ -475,6 +724,7 @@ class VideoService:
                 self.videos_collection
                 .where("niche", "==", niche)
                 .order_by("save_count", direction=firestore.Query.DESCENDING)
+                .select(fields or VIDEO_LIST_FIELDS)
                 .limit(limit)
             )
 
@@ -491,8 +741,8 @@ class VideoService:
             return {"status": "disabled"}
 
         try:
-            # Count total videos (limited for performance)
-            total_count = len(list(self.videos_collection.limit(10000).stream()))
+            # Count total videos with a server-side aggregation
+            total_count = count_documents(self.videos_collection, timeout=self.connection_timeout)
 
             # Get most saved videos
             top_videos = list(
@@ -4,6 +4,9 @@ Async utilities and helpers for better async patterns
 
 import asyncio
 import functools
+import os
+import random
+import time
 from typing import Any, Callable, Coroutine, List, Optional, TypeVar, Union
 from concurrent.futures import ThreadPoolExecutor
 import logging
@@ -12,6 +15,23 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Concurrent I/O-bound operations per CPU used when no explicit limit is given
+DEFAULT_CONCURRENCY_MULTIPLIER = 3
+
+
+@functools.lru_cache(maxsize=None)
+def get_default_concurrency() -> int:
+    """
+    Default concurrency limit for I/O-bound async work: CPU count times
+    ASYNC_CONCURRENCY_MULTIPLIER (default 3).
+    """
+    try:
+        multiplier = int(os.getenv("ASYNC_CONCURRENCY_MULTIPLIER", DEFAULT_CONCURRENCY_MULTIPLIER))
+    except ValueError:
+        logger.warning("Invalid ASYNC_CONCURRENCY_MULTIPLIER, using default")
+        multiplier = DEFAULT_CONCURRENCY_MULTIPLIER
+    return (os.cpu_count() or 4) * max(1, multiplier)
+
 
 def run_in_executor(executor: Optional[ThreadPoolExecutor] = None):
     """
@@ -30,7 +50,9 @@ def run_in_executor(executor: Optional[ThreadPoolExecutor] = None):
     def decorator(func: Callable[..., T]) -> Callable[..., Coroutine[Any, Any, T]]:
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
+            if not kwargs:
+                return await loop.run_in_executor(executor, func, *args)
             return await loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
 
         return wrapper
@@ -49,13 +71,36 @@ async def gather_with_concurrency(limit: int, *coroutines: Coroutine[Any, Any, T
     Returns:
         List of results in the same order as input coroutines
     """
-    semaphore = asyncio.Semaphore(limit)
+    if not coroutines:
+        return []
+
+    # A fixed pool of workers pulls coroutines off a shared iterator, instead
+    # of wrapping every coroutine in its own task and semaphore acquisition.
+    results: List[Any] = [None] * len(coroutines)
+    queue = iter(enumerate(coroutines))
 
-    async def sem_coro(coro):
-        async with semaphore:
-            return await coro
+    async def worker():
+        for index, coro in queue:
+            results[index] = await coro
 
-    return await asyncio.gather(*[sem_coro(coro) for coro in coroutines])
+    try:
+        await asyncio.gather(*[worker() for _ in range(max(1, min(limit, len(coroutines))))])
+    except BaseException:
+        # Close coroutines that never got started so they don't warn on GC
+        for _, coro in queue:
+            coro.close()
+        raise
+
+    return results
+
+
+def decorrelated_jitter(previous: float, base_delay: float, max_delay: float = 30.0) -> float:
+    """
+    Next retry delay using decorrelated jitter: uniform between the base delay
+    and three times the previous delay, capped at max_delay. Concurrent callers
+    spread out instead of retrying in lockstep.
+    """
+    return min(max_delay, random.uniform(base_delay, previous * 3))
 
 
 async def retry_async(
@@ -64,6 +109,8 @@ async def retry_async(
     delay: float = 1.0,
     backoff: float = 2.0,
     exceptions: tuple = (Exception,),
+    max_delay: float = 30.0,
+    jitter: float = 0.1,
 ) -> T:
     """
     Retry an async function with exponential backoff
@@ -74,6 +121,8 @@ async def retry_async(
         delay: Initial delay between retries in seconds
         backoff: Backoff multiplier for delay
         exceptions: Tuple of exceptions to catch and retry on
+        max_delay: Upper bound for a single delay in seconds
+        jitter: Random +/- fraction applied to each delay to spread out retries
 
     Returns:
         Result of the function call
@@ -89,15 +138,19 @@ async def retry_async(
         except exceptions as e:
             last_exception = e
 
+            # No sleep after the final attempt - fail straight away
             if attempt == max_retries:
                 logger.error(f"Function {func.__name__} failed after {max_retries} retries")
                 raise e
 
-            wait_time = delay * (backoff**attempt)
-            logger.warning(
-                f"Function {func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}), "
-                f"retrying in {wait_time:.2f}s: {str(e)}"
-            )
+            wait_time = min(max_delay, delay * (backoff**attempt))
+            if jitter:
+                wait_time *= 1 + random.uniform(-jitter, jitter)
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    f"Function {func.__name__} failed (attempt {attempt + 1}/{max_retries + 1}), "
+                    f"retrying in {wait_time:.2f}s: {str(e)}"
+                )
             await asyncio.sleep(wait_time)
 
     # This should never be reached, but just in case
@@ -130,6 +183,9 @@ class AsyncBatch:
     """
     Utility for batching async operations
 
+    Full batches start running as soon as they fill up; results are returned
+    in the order the coroutines were added.
+
     Usage:
     async with AsyncBatch(batch_size=10) as batch:
         for item in items:
@@ -137,19 +193,33 @@ class AsyncBatch:
         results = await batch.execute()
     """
 
+    __slots__ = ("batch_size", "concurrency_limit", "operations", "results", "_pending")
+
     def __init__(self, batch_size: int = 10, concurrency_limit: Optional[int] = None):
         self.batch_size = batch_size
-        self.concurrency_limit = concurrency_limit or batch_size
+        self.concurrency_limit = concurrency_limit or min(batch_size, get_default_concurrency())
         self.operations: List[Coroutine] = []
         self.results: List[Any] = []
+        # Scheduled batches, in submission order. Holding the references keeps
+        # the tasks alive until execute() collects them.
+        self._pending: List[asyncio.Task] = []
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.operations:
-            # Execute any remaining operations
-            await self._execute_batch(self.operations)
+        if exc_type is not None:
+            # Don't leave batches running (or coroutines never awaited) behind
+            for task in self._pending:
+                task.cancel()
+            for coro in self.operations:
+                coro.close()
+            self._pending = []
+            self.operations = []
+            return
+
+        # Execute any remaining operations
+        await self.execute()
 
     def add(self, coro: Coroutine):
         """Add a coroutine to the batch"""
@@ -157,14 +227,12 @@ class AsyncBatch:
 
         # Auto-execute when batch is full
         if len(self.operations) >= self.batch_size:
-            asyncio.create_task(self._execute_and_clear())
+            self._schedule_batch()
 
-    async def _execute_and_clear(self):
-        """Execute current batch and clear operations"""
-        if self.operations:
-            batch_results = await self._execute_batch(self.operations)
-            self.results.extend(batch_results)
-            self.operations.clear()
+    def _schedule_batch(self):
+        """Hand the current operations to a new task and start a fresh batch"""
+        operations, self.operations = self.operations, []
+        self._pending.append(asyncio.create_task(self._execute_batch(operations)))
 
     async def _execute_batch(self, operations: List[Coroutine]) -> List[Any]:
         """Execute a batch of operations with concurrency control"""
@@ -175,7 +243,12 @@ class AsyncBatch:
 
     async def execute(self) -> List[Any]:
         """Execute all remaining operations and return all results"""
-        await self._execute_and_clear()
+        if self.operations:
+            self._schedule_batch()
+
+        pending, self._pending = self._pending, []
+        for batch_results in await asyncio.gather(*pending):
+            self.results.extend(batch_results)
         return self.results
 
 
@@ -222,14 +295,24 @@ def async_cached_property(func):
     result = await obj.expensive_property  # Computed once
     result = await obj.expensive_property  # Cached result
     """
-    cache_attr = f"_cached_{func.__name__}"
+    # The task is cached rather than its result, so concurrent awaiters share a
+    # single computation. Failed or cancelled tasks are evicted to allow a retry.
+    cache_attr = f"_cached_task_{func.__name__}"
 
     @functools.wraps(func)
     async def wrapper(self):
-        if not hasattr(self, cache_attr):
-            result = await func(self)
-            setattr(self, cache_attr, result)
-        return getattr(self, cache_attr)
+        task = self.__dict__.get(cache_attr)
+        if task is None:
+            task = asyncio.ensure_future(func(self))
+            self.__dict__[cache_attr] = task
+
+            def evict_on_failure(done: asyncio.Future):
+                if done.cancelled() or done.exception() is not None:
+                    self.__dict__.pop(cache_attr, None)
+
+            task.add_done_callback(evict_on_failure)
+        # Shield so one cancelled awaiter doesn't cancel the shared computation
+        return await asyncio.shield(task)
 
     return wrapper
 
@@ -248,6 +331,9 @@ async def run_periodic_task(
         max_iterations: Maximum number of iterations (None for infinite)
     """
     iteration = 0
+    # Sleep until the next deadline rather than a full interval after each run,
+    # so the task's own runtime doesn't accumulate as drift
+    deadline = time.monotonic()
 
     while max_iterations is None or iteration < max_iterations:
         try:
@@ -255,5 +341,13 @@ async def run_periodic_task(
         except Exception as e:
             logger.error(f"Error in periodic task: {e}")
 
-        await asyncio.sleep(interval)
+        deadline += interval
+        sleep_for = deadline - time.monotonic()
+        if sleep_for > 0:
+            await asyncio.sleep(sleep_for)
+        else:
+            # Fell behind; restart the schedule from now instead of bursting,
+            # but still yield to the event loop
+            deadline = time.monotonic()
+            await asyncio.sleep(0)
         iteration += 1
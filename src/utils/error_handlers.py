@@ -3,19 +3,39 @@ Centralized error handling for FastAPI
 """
 
 from fastapi import Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import ValidationError as PydanticValidationError
 from datetime import datetime
 from typing import Union
+import logging
 import traceback
 
 from src.exceptions import SetsAIException
+from src.utils.json_utils import ORJSON_AVAILABLE
 from src.utils.logging import StructuredLogger, get_request_context
 
 logger = StructuredLogger(__name__)
 
+# Serialize responses with orjson when it is installed
+DefaultJSONResponse = ORJSONResponse if ORJSON_AVAILABLE else JSONResponse
+
+# Map HTTP status codes to error codes
+_HTTP_ERROR_CODES = {
+    400: "BAD_REQUEST",
+    401: "UNAUTHORIZED",
+    403: "FORBIDDEN",
+    404: "NOT_FOUND",
+    405: "METHOD_NOT_ALLOWED",
+    409: "CONFLICT",
+    429: "RATE_LIMIT_EXCEEDED",
+    500: "INTERNAL_ERROR",
+    502: "BAD_GATEWAY",
+    503: "SERVICE_UNAVAILABLE",
+    504: "GATEWAY_TIMEOUT",
+}
+
 
 async def sets_ai_exception_handler(request: Request, exc: SetsAIException) -> JSONResponse:
     """Handle custom SetsAI exceptions"""
@@ -32,7 +52,7 @@ async def sets_ai_exception_handler(request: Request, exc: SetsAIException) -> J
         cause=str(exc.cause) if exc.cause else None,
     )
 
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=exc.status_code,
         content={
             "error": exc.to_dict(),
@@ -63,15 +83,16 @@ async def validation_exception_handler(
                 }
             )
 
-    logger.warning(
-        "Validation error occurred",
-        error_type="validation_error",
-        validation_errors=errors,
-        path=request.url.path,
-        method=request.method,
-    )
+    if logger.is_enabled_for(logging.WARNING):
+        logger.warning(
+            "Validation error occurred",
+            error_type="validation_error",
+            validation_errors=errors,
+            path=request.url.path,
+            method=request.method,
+        )
 
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=422,
         content={
             "error": {
@@ -90,33 +111,19 @@ async def http_exception_handler(request: Request, exc: HTTPException) -> JSONRe
     """Handle FastAPI HTTP exceptions"""
     context = get_request_context()
 
-    # Map HTTP status codes to error codes
-    error_code_map = {
-        400: "BAD_REQUEST",
-        401: "UNAUTHORIZED",
-        403: "FORBIDDEN",
-        404: "NOT_FOUND",
-        405: "METHOD_NOT_ALLOWED",
-        409: "CONFLICT",
-        429: "RATE_LIMIT_EXCEEDED",
-        500: "INTERNAL_ERROR",
-        502: "BAD_GATEWAY",
-        503: "SERVICE_UNAVAILABLE",
-        504: "GATEWAY_TIMEOUT",
-    }
-
-    error_code = error_code_map.get(exc.status_code, "HTTP_ERROR")
-
-    logger.warning(
-        f"HTTP exception: {exc.status_code}",
-        error_code=error_code,
-        error_message=exc.detail,
-        status_code=exc.status_code,
-        path=request.url.path,
-        method=request.method,
-    )
+    error_code = _HTTP_ERROR_CODES.get(exc.status_code, "HTTP_ERROR")
+
+    if logger.is_enabled_for(logging.WARNING):
+        logger.warning(
+            f"HTTP exception: {exc.status_code}",
+            error_code=error_code,
+            error_message=exc.detail,
+            status_code=exc.status_code,
+            path=request.url.path,
+            method=request.method,
+        )
 
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {"code": error_code, "message": exc.detail, "status_code": exc.status_code},
@@ -133,15 +140,16 @@ async def starlette_http_exception_handler(
     """Handle Starlette HTTP exceptions"""
     context = get_request_context()
 
-    logger.warning(
-        f"Starlette HTTP exception: {exc.status_code}",
-        error_message=exc.detail,
-        status_code=exc.status_code,
-        path=request.url.path,
-        method=request.method,
-    )
+    if logger.is_enabled_for(logging.WARNING):
+        logger.warning(
+            f"Starlette HTTP exception: {exc.status_code}",
+            error_message=exc.detail,
+            status_code=exc.status_code,
+            path=request.url.path,
+            method=request.method,
+        )
 
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=exc.status_code,
         content={
             "error": {"code": "HTTP_ERROR", "message": exc.detail, "status_code": exc.status_code},
@@ -156,32 +164,36 @@ async def general_exception_handler(request: Request, exc: Exception) -> JSONRes
     """Handle unexpected exceptions"""
     context = get_request_context()
 
-    # Get traceback for debugging
-    tb_str = traceback.format_exc()
+    debug = context.get("service") == "test" or request.headers.get("X-Debug") == "true"
+    log_error = logger.is_enabled_for(logging.ERROR)
 
-    logger.error(
-        "Unhandled exception occurred",
-        error_type=type(exc).__name__,
-        error_message=str(exc),
-        path=request.url.path,
-        method=request.method,
-        traceback=tb_str,
-        exc_info=True,
-    )
+    # Format the traceback only if the log or the response will carry it
+    tb_str = traceback.format_exc() if log_error or debug else ""
+
+    if log_error:
+        logger.error(
+            "Unhandled exception occurred",
+            error_type=type(exc).__name__,
+            error_message=str(exc),
+            path=request.url.path,
+            method=request.method,
+            traceback=tb_str,
+            exc_info=True,
+        )
 
     # Don't expose internal error details in production
     error_message = "An unexpected error occurred"
     details = {}
 
     # In development, include more details
-    if context.get("service") == "test" or request.headers.get("X-Debug") == "true":
+    if debug:
         error_message = str(exc)
         details = {
             "exception_type": type(exc).__name__,
             "traceback": tb_str.split("\n")[-10:],  # Last 10 lines
         }
 
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=500,
         content={
             "error": {"code": "INTERNAL_ERROR", "message": error_message, "details": details},
@@ -1,30 +1,145 @@
+import functools
+import hashlib
+import io
 import logging
 import subprocess
-from typing import Optional
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+try:
+    from PIL import Image
+    import pillow_heif
+    # Register HEIF opener with PIL
+    pillow_heif.register_heif_opener()
+    PILLOW_AVAILABLE = True
+except ImportError:
+    PILLOW_AVAILABLE = False
 
 
 logger = logging.getLogger(__name__)
 
 
-def _is_jpeg(image_bytes: bytes) -> bool:
-    """Lightweight check to determine if bytes are already JPEG."""
-    if not image_bytes or len(image_bytes) < 3:
-        return False
-    # JPEG starts with 0xFF 0xD8 0xFF
-    return image_bytes[0] == 0xFF and image_bytes[1] == 0xD8 and image_bytes[2] == 0xFF
+# Upper bound on the JPEG bytes each memoized conversion keeps in memory
+DEFAULT_CACHE_MAX_BYTES = 16 * 1024 * 1024
 
 
-def convert_image_to_jpeg(image_bytes: bytes) -> Optional[bytes]:
-    """Convert arbitrary image bytes (e.g., HEIC/WEBP/PNG) to JPEG using ffmpeg.
+def memoize_by_content(max_entries: int = 32, max_bytes: int = DEFAULT_CACHE_MAX_BYTES):
+    """Memoize a bytes -> bytes image conversion by a digest of its input.
+
+    Keys are 16-byte BLAKE2b digests, so large inputs are not retained by the
+    cache. Outputs are bounded both by count and by total size; the least
+    recently used entries are evicted first, and an output larger than
+    max_bytes is not cached. Failed conversions (exceptions or None results)
+    are not cached.
+    """
+
+    def decorator(func: Callable[[bytes], Optional[bytes]]) -> Callable[[bytes], Optional[bytes]]:
+        cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        cached_bytes = 0
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(image_bytes: bytes) -> Optional[bytes]:
+            nonlocal cached_bytes
+            key = hashlib.blake2b(image_bytes, digest_size=16).digest()
+            with lock:
+                cached = cache.get(key)
+                if cached is not None:
+                    cache.move_to_end(key)
+                    return cached
+
+            result = func(image_bytes)
+
+            if result is not None and len(result) <= max_bytes:
+                with lock:
+                    previous = cache.pop(key, None)
+                    if previous is not None:
+                        cached_bytes -= len(previous)
+                    cache[key] = result
+                    cached_bytes += len(result)
+                    while len(cache) > max_entries or cached_bytes > max_bytes:
+                        _, evicted = cache.popitem(last=False)
+                        cached_bytes -= len(evicted)
+            return result
+
+        def cache_clear():
+            nonlocal cached_bytes
+            with lock:
+                cache.clear()
+                cached_bytes = 0
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+
+    return decorator
+
+
+@memoize_by_content()
+def convert_heic_to_jpeg(heic_content: bytes) -> bytes:
+    """Convert HEIC image content to JPEG format using Pillow.
+
+    Slideshows are re-analyzed on retries and across users, so results are
+    memoized by content digest to skip repeated decode/encode work.
+    """
+    if not PILLOW_AVAILABLE:
+        raise RuntimeError("Pillow and pillow-heif are required for HEIC conversion")
+
+    # Open HEIC image from bytes
+    heic_image = Image.open(io.BytesIO(heic_content))
+
+    # Convert to RGB if necessary (HEIC can be in different color modes)
+    if heic_image.mode != "RGB":
+        heic_image = heic_image.convert("RGB")
+
+    # Save as JPEG to bytes buffer
+    jpeg_buffer = io.BytesIO()
+    heic_image.save(jpeg_buffer, format="JPEG", quality=85, optimize=True)
+    return jpeg_buffer.getvalue()
+
+
+def sniff_image_format(image_bytes: bytes) -> Optional[str]:
+    """Identify an image format from its magic bytes.
 
-    Returns JPEG bytes on success, or None on failure.
+    Returns one of "jpeg", "png", "webp", "gif", "bmp", "avif" or "heic"
+    (any other ISO-BMFF "ftyp" image), or None if unrecognized.
     """
     if not image_bytes:
         return None
+    if image_bytes[:3] == b"\xff\xd8\xff":
+        return "jpeg"
+    if image_bytes[:8] == b"\x89PNG\r\n\x1a\n":
+        return "png"
+    if image_bytes[:4] == b"RIFF" and image_bytes[8:12] == b"WEBP":
+        return "webp"
+    if image_bytes[:6] in (b"GIF87a", b"GIF89a"):
+        return "gif"
+    if image_bytes[:2] == b"BM":
+        return "bmp"
+    if len(image_bytes) > 12 and image_bytes[4:8] == b"ftyp":
+        return "avif" if image_bytes[8:12] == b"avif" else "heic"
+    return None
 
-    if _is_jpeg(image_bytes):
-        return image_bytes
 
+def _convert_with_pillow(image_bytes: bytes) -> Optional[bytes]:
+    """Decode and re-encode as JPEG in-process. Returns None if Pillow can't read the image."""
+    try:
+        image = Image.open(io.BytesIO(image_bytes))
+        image.load()
+    except (Image.UnidentifiedImageError, OSError) as e:
+        logger.debug("Pillow could not decode image, falling back to ffmpeg: %s", e)
+        return None
+
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    jpeg_buffer = io.BytesIO()
+    image.save(jpeg_buffer, format="JPEG", quality=90)
+    return jpeg_buffer.getvalue()
+
+
+def _convert_with_ffmpeg(image_bytes: bytes) -> Optional[bytes]:
+    """Transcode image bytes to JPEG with an ffmpeg subprocess."""
     try:
         # Use ffmpeg to transcode to MJPEG with good quality
         # -nostdin to avoid waiting for input on TTY-less envs
@@ -56,5 +171,33 @@ def convert_image_to_jpeg(image_bytes: bytes) -> Optional[bytes]:
     except subprocess.CalledProcessError as e:
         logger.error(f"ffmpeg failed to convert image to JPEG: {e}")
         return None
+    except FileNotFoundError:
+        logger.error("ffmpeg is not installed; cannot convert image to JPEG")
+        return None
+
+
+def convert_image_to_jpeg(image_bytes: bytes) -> Optional[bytes]:
+    """Convert arbitrary image bytes (e.g., HEIC/WEBP/PNG) to JPEG.
+
+    Decodes in-process with Pillow when available; formats Pillow can't read
+    fall back to an ffmpeg subprocess. Returns JPEG bytes on success, or None
+    on failure.
+    """
+    if not image_bytes:
+        return None
+
+    if sniff_image_format(image_bytes) == "jpeg":
+        return image_bytes
+
+    return _transcode_to_jpeg(image_bytes)
+
 
+@memoize_by_content(max_entries=128)
+def _transcode_to_jpeg(image_bytes: bytes) -> Optional[bytes]:
+    """Re-encode non-JPEG image bytes, memoized so repeated images skip the work."""
+    if PILLOW_AVAILABLE:
+        jpeg_bytes = _convert_with_pillow(image_bytes)
+        if jpeg_bytes is not None:
+            return jpeg_bytes
 
+    return _convert_with_ffmpeg(image_bytes)
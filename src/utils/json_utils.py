@@ -0,0 +1,37 @@
+"""
+Fast JSON helpers with a stdlib fallback
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text, using orjson when it is installed
+
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can
+    catch the same exceptions regardless of which backend is active.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serialize to compact JSON text, using orjson when it is installed
+
+    Values that aren't JSON-native (datetimes excepted under orjson) are
+    rendered with str() rather than raising.
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=str, separators=(",", ":"))
@@ -2,13 +2,15 @@
 Structured logging utilities for request correlation and observability
 """
 
+import functools
 import logging
-import json
+import secrets
+import sys
 import time
-from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from contextvars import ContextVar
-from fastapi import Request
+
+from src.utils.json_utils import json_dumps
 
 # Context variables for request tracing
 request_id_var: ContextVar[str] = ContextVar("request_id", default="")
@@ -16,10 +18,27 @@ operation_var: ContextVar[str] = ContextVar("operation", default="")
 service_var: ContextVar[str] = ContextVar("service", default="api")
 user_id_var: ContextVar[str] = ContextVar("user_id", default="")
 
+# Snapshot of the above as (service, request_id, operation, user_id or None),
+# refreshed whenever they change so each log line does a single lookup
+_log_context_var: ContextVar[Optional[Tuple[str, str, str, Optional[str]]]] = ContextVar(
+    "log_context", default=None
+)
+
+# Severity names used in structured logs, mapped to stdlib logging levels
+_SEVERITY_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL,
+}
+
 
 class StructuredLogger:
     """Structured logger with request correlation"""
 
+    __slots__ = ("logger", "service_name")
+
     def __init__(self, name: str):
         self.logger = logging.getLogger(name)
         self.service_name = name.split(".")[-1]  # Extract service name from module
@@ -28,12 +47,22 @@ class StructuredLogger:
         self, message: str, extra: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """Build structured log data with context"""
+        # Integer epoch fields Cloud Logging reads as the entry timestamp,
+        # avoiding datetime construction and ISO formatting per line
+        now_ns = time.time_ns()
+        context = _log_context_var.get()
+        if context is None:
+            # Outside a request: no correlation fields, service from the logger name
+            service, request_id, operation, user_id = self.service_name, "", "", None
+        else:
+            service, request_id, operation, user_id = context
         log_data = {
-            "timestamp": datetime.utcnow().isoformat() + "Z",
-            "service": service_var.get(self.service_name),
-            "request_id": request_id_var.get(),
-            "operation": operation_var.get(),
-            "user_id": user_id_var.get() or None,
+            "timestampSeconds": now_ns // 1_000_000_000,
+            "timestampNanos": now_ns % 1_000_000_000,
+            "service": service,
+            "request_id": request_id,
+            "operation": operation,
+            "user_id": user_id,
             "message": message,
         }
 
@@ -47,13 +76,21 @@ class StructuredLogger:
 
         return log_data
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether messages at this stdlib logging level would be emitted"""
+        return self.logger.isEnabledFor(level)
+
     def _log_structured(self, level: str, message: str, **kwargs):
         """Log structured data to stdout for Cloud Logging"""
+        # Honour the configured log level before building the payload
+        if not self.logger.isEnabledFor(_SEVERITY_LEVELS[level]):
+            return
+
         log_data = self._build_log_data(message, kwargs)
         log_data["severity"] = level
 
-        # Use print to stdout which Cloud Run captures as structured logs
-        print(json.dumps(log_data))
+        # Write one line to stdout, which Cloud Run captures as structured logs
+        sys.stdout.write(json_dumps(log_data) + "\n")
 
     def info(self, message: str, **kwargs):
         """Log info level message with structured data"""
@@ -76,6 +113,12 @@ class StructuredLogger:
         self._log_structured("CRITICAL", message, **kwargs)
 
 
+@functools.lru_cache(maxsize=None)
+def _get_logger(name: str) -> StructuredLogger:
+    """Get a shared StructuredLogger for a name"""
+    return StructuredLogger(name)
+
+
 def set_request_context(
     request_id: str, operation: str = "", service: str = "api", user_id: str = ""
 ):
@@ -84,6 +127,14 @@ def set_request_context(
     operation_var.set(operation)
     service_var.set(service)
     user_id_var.set(user_id)
+    _refresh_log_context()
+
+
+def _refresh_log_context():
+    """Rebuild the per-line log context snapshot from the request context vars"""
+    _log_context_var.set(
+        (service_var.get(), request_id_var.get(), operation_var.get(), user_id_var.get() or None)
+    )
 
 
 def get_request_context() -> Dict[str, str]:
@@ -100,7 +151,10 @@ def log_performance_metric(
     operation: str, duration_ms: float, success: bool = True, **additional_metrics
 ):
     """Log performance metrics in structured format"""
-    logger = StructuredLogger(__name__)
+    logger = _get_logger(__name__)
+    # Nothing to build if the metric line would be filtered out anyway
+    if not logger.is_enabled_for(logging.INFO if success else logging.WARNING):
+        return
 
     metric_data = {
         "event_type": "performance_metric",
@@ -118,12 +172,13 @@ def log_performance_metric(
 
 def log_business_event(event_type: str, event_data: Dict[str, Any], user_id: str = None):
     """Log business events for analytics"""
-    logger = StructuredLogger(__name__)
+    logger = _get_logger(__name__)
 
     # Temporarily set user context if provided
     original_user_id = user_id_var.get()
     if user_id:
         user_id_var.set(user_id)
+        _refresh_log_context()
 
     try:
         logger.info(
@@ -135,6 +190,24 @@ def log_business_event(event_type: str, event_data: Dict[str, Any], user_id: str
     finally:
         # Restore original user context
         user_id_var.set(original_user_id)
+        if user_id:
+            _refresh_log_context()
+
+
+# Request headers read by RequestLoggingMiddleware
+_LOGGED_HEADERS = frozenset({
+    b"x-request-id", b"x-user-id", b"user-agent", b"content-length",
+    b"x-forwarded-for", b"x-real-ip",
+})
+
+
+def _scope_headers(scope) -> Dict[str, str]:
+    """Collect the logged headers from an ASGI scope (first value wins, like Request.headers)"""
+    headers: Dict[str, str] = {}
+    for name, value in scope.get("headers", ()):
+        if name in _LOGGED_HEADERS:
+            headers.setdefault(name.decode("latin-1"), value.decode("latin-1"))
+    return headers
 
 
 class RequestLoggingMiddleware:
@@ -149,33 +222,37 @@ class RequestLoggingMiddleware:
             await self.app(scope, receive, send)
             return
 
-        # Extract request information
-        request = Request(scope, receive)
+        # Read what we need straight from the ASGI scope rather than building a Request
+        headers = _scope_headers(scope)
+        method = scope["method"]
+        path = scope["path"]
+        query_string = scope.get("query_string", b"")
 
         # Generate or extract request ID
-        request_id = request.headers.get("X-Request-ID", f"{time.time()}-{id(request)}")
-        operation = f"{request.method} {request.url.path}"
+        request_id = headers.get("x-request-id") or secrets.token_hex(8)
+        operation = f"{method} {path}"
 
         # Extract user information if available (from headers, auth, etc.)
-        user_id = request.headers.get("X-User-ID", "")
+        user_id = headers.get("x-user-id", "")
 
         # Set request context
         set_request_context(
             request_id=request_id, operation=operation, service="api", user_id=user_id
         )
 
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         # Log request start
-        self.logger.info(
-            "Request started",
-            method=request.method,
-            path=request.url.path,
-            query_params=str(request.query_params) if request.query_params else None,
-            user_agent=request.headers.get("User-Agent", ""),
-            client_ip=self._get_client_ip(request),
-            content_length=request.headers.get("Content-Length"),
-        )
+        if self.logger.is_enabled_for(logging.INFO):
+            self.logger.info(
+                "Request started",
+                method=method,
+                path=path,
+                query_params=query_string.decode("latin-1") if query_string else None,
+                user_agent=headers.get("user-agent", ""),
+                client_ip=self._get_client_ip(headers, scope),
+                content_length=headers.get("content-length"),
+            )
 
         # Process request
         response_started = False
@@ -187,9 +264,10 @@ class RequestLoggingMiddleware:
                 response_started = True
                 status_code = message["status"]
                 # Add request ID to response headers
+                process_time = (time.monotonic_ns() - start_ns) / 1e9
                 headers = list(message.get("headers", []))
                 headers.append((b"x-request-id", request_id.encode()))
-                headers.append((b"x-process-time", str(time.time() - start_time).encode()))
+                headers.append((b"x-process-time", str(process_time).encode()))
                 message["headers"] = headers
 
             await send(message)
@@ -207,38 +285,39 @@ class RequestLoggingMiddleware:
             raise
         finally:
             # Log request completion
-            process_time = time.time() - start_time
+            process_time_ms = (time.monotonic_ns() - start_ns) / 1e6
 
             self.logger.info(
                 "Request completed",
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
                 status_code=status_code,
-                process_time_ms=round(process_time * 1000, 2),
+                process_time_ms=round(process_time_ms, 2),
                 response_started=response_started,
             )
 
             # Log performance metric
             log_performance_metric(
                 operation=operation,
-                duration_ms=process_time * 1000,
+                duration_ms=process_time_ms,
                 success=200 <= status_code < 400,
                 status_code=status_code,
-                method=request.method,
-                path=request.url.path,
+                method=method,
+                path=path,
             )
 
-    def _get_client_ip(self, request: Request) -> str:
+    def _get_client_ip(self, headers: Dict[str, str], scope) -> str:
         """Extract client IP from request headers"""
         # Check for forwarded headers (common in load balancers)
-        forwarded_for = request.headers.get("X-Forwarded-For")
+        forwarded_for = headers.get("x-forwarded-for")
         if forwarded_for:
             # Take the first IP in the chain
-            return forwarded_for.split(",")[0].strip()
+            return forwarded_for.partition(",")[0].strip()
 
-        real_ip = request.headers.get("X-Real-IP")
+        real_ip = headers.get("x-real-ip")
         if real_ip:
             return real_ip
 
         # Fallback to direct client
-        return request.client.host if request.client else "unknown"
+        client = scope.get("client")
+        return client[0] if client else "unknown"
@@ -1,3 +1,4 @@
+import asyncio
 import ffmpeg
 import tempfile
 import os
@@ -38,13 +39,13 @@ class VideoProcessor:
         try:
             temp_fd, temp_path = tempfile.mkstemp(suffix=suffix)
             os.close(temp_fd)  # Close file descriptor, keep path
-            logger.debug(f"Created temp file: {temp_path}")
+            logger.debug("Created temp file: %s", temp_path)
             yield temp_path
         finally:
             if temp_path and os.path.exists(temp_path):
                 try:
                     os.unlink(temp_path)
-                    logger.debug(f"Cleaned up temp file: {temp_path}")
+                    logger.debug("Cleaned up temp file: %s", temp_path)
                 except OSError as e:
                     logger.warning(f"Failed to cleanup temp file {temp_path}: {e}")
 
@@ -54,13 +55,13 @@ class VideoProcessor:
         temp_dir = None
         try:
             temp_dir = tempfile.mkdtemp(prefix="video_processing_")
-            logger.debug(f"Created temp directory: {temp_dir}")
+            logger.debug("Created temp directory: %s", temp_dir)
             yield temp_dir
         finally:
             if temp_dir and os.path.exists(temp_dir):
                 try:
                     shutil.rmtree(temp_dir)
-                    logger.debug(f"Cleaned up temp directory: {temp_dir}")
+                    logger.debug("Cleaned up temp directory: %s", temp_dir)
                 except OSError as e:
                     logger.warning(f"Failed to cleanup temp directory {temp_dir}: {e}")
 
@@ -154,67 +155,13 @@ class VideoProcessor:
 
         return video_content, metadata
 
-    async def remove_audio(self, video_content: bytes) -> bytes:
-        """Remove audio from video with guaranteed cleanup"""
-        with self.temp_file(suffix=".mp4") as input_path, self.temp_file(
-            suffix=".mp4"
-        ) as output_path:
+    # File writes and ffmpeg runs block, so they go through asyncio.to_thread to
+    # keep the event loop serving other requests and jobs meanwhile
 
-            # Write input video
-            try:
-                with open(input_path, "wb") as f:
-                    f.write(video_content)
-            except IOError as e:
-                logger.error(f"Failed to write input video file: {e}")
-                raise VideoProcessingError(message=f"Failed to write video content: {e}", cause=e)
-
-            # Process with ffmpeg
-            try:
-                (
-                    ffmpeg.input(input_path)
-                    .output(
-                        output_path,
-                        an=None,  # Remove audio
-                        vcodec="copy",  # Copy video codec
-                        movflags="faststart",
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
-
-                # Read output
-                try:
-                    with open(output_path, "rb") as f:
-                        silent_video = f.read()
-
-                    if not silent_video:
-                        raise VideoFormatError(
-                            message="FFmpeg produced empty output file",
-                            format_info="Empty output after audio removal",
-                        )
-
-                    logger.debug(f"Successfully processed video: {len(silent_video)} bytes")
-                    return silent_video
-
-                except IOError as e:
-                    logger.error(f"Failed to read processed video file: {e}")
-                    raise VideoProcessingError(
-                        message=f"Failed to read processed video: {e}", cause=e
-                    )
-
-            except ffmpeg.Error as e:
-                stderr_output = e.stderr.decode() if e.stderr else "No error details"
-                logger.error(f"FFmpeg processing failed: {stderr_output}")
-                raise VideoFormatError(
-                    message=f"Video processing failed: {stderr_output}",
-                    format_info="FFmpeg processing error",
-                    cause=e,
-                )
-            except Exception as e:
-                logger.error(f"Unexpected error during video processing: {e}")
-                raise VideoProcessingError(message=f"Video processing failed: {str(e)}", cause=e)
-
-        # Temp files automatically cleaned up by context managers
+    @staticmethod
+    def _write_bytes(path: str, content: bytes) -> None:
+        with open(path, "wb") as f:
+            f.write(content)
 
     async def extract_first_frame(self, video_content: bytes) -> bytes:
         """Extract first frame from video as JPEG
@@ -228,52 +175,38 @@ class VideoProcessor:
         Raises:
             VideoProcessingError: If frame extraction fails
         """
-        with self.temp_file(suffix=".mp4") as input_path, self.temp_file(
-            suffix=".jpg"
-        ) as output_path:
+        # Input stays on disk: MP4s often carry the moov atom at the end, which
+        # ffmpeg can only reach by seeking. The frame is streamed back on stdout.
+        with self.temp_file(suffix=".mp4") as input_path:
 
             # Write input video
             try:
-                with open(input_path, "wb") as f:
-                    f.write(video_content)
+                await asyncio.to_thread(self._write_bytes, input_path, video_content)
             except IOError as e:
                 logger.error(f"Failed to write input video file: {e}")
                 raise VideoProcessingError(message=f"Failed to write video content: {e}", cause=e)
 
             # Extract first frame using ffmpeg
             try:
-                (
-                    ffmpeg.input(input_path)
-                    .output(
-                        output_path,
-                        vframes=1,  # Extract only 1 frame
-                        f="image2",  # Force image output format
-                        vcodec="mjpeg",  # Use JPEG codec
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
+                stream = ffmpeg.input(input_path).output(
+                    "pipe:",
+                    vframes=1,  # Extract only 1 frame
+                    f="image2pipe",  # Write the image to stdout
+                    vcodec="mjpeg",  # Use JPEG codec
+                )
+                frame_data, _ = await asyncio.to_thread(
+                    stream.run, capture_stdout=True, capture_stderr=True
                 )
 
-                # Read the extracted frame
-                try:
-                    with open(output_path, "rb") as f:
-                        frame_data = f.read()
-
-                    if not frame_data:
-                        raise VideoFormatError(
-                            message="FFmpeg produced empty frame file",
-                            format_info="Empty output after frame extraction",
-                        )
-
-                    logger.debug(f"Successfully extracted first frame: {len(frame_data)} bytes")
-                    return frame_data
-
-                except IOError as e:
-                    logger.error(f"Failed to read extracted frame file: {e}")
-                    raise VideoProcessingError(
-                        message=f"Failed to read extracted frame: {e}", cause=e
+                if not frame_data:
+                    raise VideoFormatError(
+                        message="FFmpeg produced empty frame output",
+                        format_info="Empty output after frame extraction",
                     )
 
+                logger.debug("Successfully extracted first frame: %s bytes", len(frame_data))
+                return frame_data
+
             except ffmpeg.Error as e:
                 stderr_output = e.stderr.decode() if e.stderr else "No error details"
                 logger.error(f"FFmpeg frame extraction failed: {stderr_output}")
@@ -312,5 +245,5 @@ class VideoProcessor:
         if not image_data:
             raise VideoProcessingError(message=f"Image at index {index} is empty")
 
-        logger.debug(f"Extracted image {index} from slideshow: {len(image_data)} bytes")
+        logger.debug("Extracted image %s from slideshow: %s bytes", index, len(image_data))
         return image_data
@@ -12,11 +12,14 @@ from datetime import datetime, timedelta, timezone
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 import socket
+from typing import Awaitable, Optional
 
 
-from src.services.genai_service_pool import GenAIServicePool
+from src.exceptions import VideoFormatError, UnsupportedPlatformError
+from src.services.genai_service_pool import get_genai_service_pool
 from src.services.cache_service import CacheService
 from src.services.queue_service import QueueService
+from src.services.firestore_client import count_documents
 from src.worker.video_processor import VideoProcessor
 from src.services.config_validator import validate_required_env_vars, get_config_with_defaults
 
@@ -44,6 +47,17 @@ POLLING_INTERVAL = config["worker_polling_interval"]
 WORKER_BATCH_SIZE = config["worker_batch_size"]
 WORKER_SHUTDOWN_TIMEOUT = config["worker_shutdown_timeout"]
 
+# Error message fragments (lowercase) that mark a job as not worth retrying
+_NON_RETRYABLE_PATTERNS = (
+    "invalid url",
+    "malformed url",
+    "video not found",
+    "private video",
+    "video unavailable",
+    "unsupported format",
+    "invalid video id",
+)
+
 logger.info(
     f"Starting worker - Environment: {environment}, Project: {project_id}, Worker ID: {WORKER_ID}"
 )
@@ -65,7 +79,7 @@ class VideoWorker:
         self._cleanup_interval = timedelta(hours=1)  # Run cleanup every hour
 
         # Initialize services
-        self.genai_pool = GenAIServicePool()
+        self.genai_pool = get_genai_service_pool()
         self.cache_service = CacheService()
         self.queue_service = QueueService()
         self.video_processor = VideoProcessor()
@@ -77,7 +91,7 @@ class VideoWorker:
         job_id = job["job_id"]
         url = job["url"]
         localization = job.get("localization")
-        start_time = time.time()
+        start_ns = time.monotonic_ns()
 
         try:
             logger.info(f"Processing job {job_id} - URL: {url[:50]}...")
@@ -102,7 +116,6 @@ class VideoWorker:
             transcript = metadata_dict.get("transcript_text")
             caption = metadata_dict.get("caption", "")
             description = metadata_dict.get("description", "")
-            extracted_image_base64 = None
 
             if transcript:
                 logger.info(f"Job {job_id} - Got transcript/caption: {len(transcript)} characters")
@@ -127,21 +140,19 @@ class VideoWorker:
                     if slideshow_transcript:
                         transcript = slideshow_transcript
 
-                    # Extract first image from slideshow
-                    if slideshow_images:
-                        try:
-                            first_image = await self.video_processor.extract_image_from_slideshow(
-                                slideshow_images
-                            )
-                            extracted_image_base64 = f"data:image/jpeg;base64,{base64.b64encode(first_image).decode('utf-8')}"
-                            logger.info(f"Job {job_id} - Extracted first image from slideshow")
-                        except Exception as e:
-                            logger.warning(f"Job {job_id} - Failed to extract slideshow image: {e}")
-
-                    # Analyze slideshow with GenAI
+                    # Extract the first image while GenAI analyzes the slideshow
                     logger.info(f"Job {job_id} - Analyzing slideshow with AI...")
-                    workout_json = await self.genai_pool.analyze_slideshow(
-                        slideshow_images, transcript, caption, description, localization
+                    extracted_image_base64, workout_json = await asyncio.gather(
+                        self._extract_preview_image(
+                            job_id,
+                            self.video_processor.extract_image_from_slideshow(slideshow_images)
+                            if slideshow_images
+                            else None,
+                            "first image from slideshow",
+                        ),
+                        self.genai_pool.analyze_slideshow(
+                            slideshow_images, transcript, caption, description, localization
+                        ),
                     )
                 else:
                     # Handle Instagram slideshows - same pattern as TikTok
@@ -154,40 +165,36 @@ class VideoWorker:
                     if slideshow_transcript:
                         transcript = slideshow_transcript
 
-                    # Extract first image from slideshow
-                    if slideshow_images:
-                        try:
-                            first_image = await self.video_processor.extract_image_from_slideshow(
-                                slideshow_images
-                            )
-                            extracted_image_base64 = f"data:image/jpeg;base64,{base64.b64encode(first_image).decode('utf-8')}"
-                            logger.info(f"Job {job_id} - Extracted first image from Instagram slideshow")
-                        except Exception as e:
-                            logger.warning(f"Job {job_id} - Failed to extract Instagram slideshow image: {e}")
-
-                    # Analyze slideshow with GenAI
+                    # Extract the first image while GenAI analyzes the slideshow
                     logger.info(f"Job {job_id} - Analyzing Instagram slideshow with AI...")
-                    workout_json = await self.genai_pool.analyze_slideshow(
-                        slideshow_images, transcript, caption, description, localization
+                    extracted_image_base64, workout_json = await asyncio.gather(
+                        self._extract_preview_image(
+                            job_id,
+                            self.video_processor.extract_image_from_slideshow(slideshow_images)
+                            if slideshow_images
+                            else None,
+                            "first image from Instagram slideshow",
+                        ),
+                        self.genai_pool.analyze_slideshow(
+                            slideshow_images, transcript, caption, description, localization
+                        ),
                     )
             else:
                 # Handle regular video content
                 logger.info(f"Job {job_id} - Processing regular video")
 
-                # Extract first frame from video
-                try:
-                    first_frame = await self.video_processor.extract_first_frame(video_content)
-                    extracted_image_base64 = (
-                        f"data:image/jpeg;base64,{base64.b64encode(first_frame).decode('utf-8')}"
-                    )
-                    logger.info(f"Job {job_id} - Extracted first frame from video")
-                except Exception as e:
-                    logger.warning(f"Job {job_id} - Failed to extract video frame: {e}")
-
-                # 2. Analyze with Gemini (no audio removal needed)
+                # 2. Analyze with Gemini (no audio removal needed), extracting
+                # the first frame locally while the request is in flight
                 logger.info(f"Job {job_id} - Analyzing video with AI...")
-                workout_json = await self.genai_pool.analyze_video(
-                    video_content, transcript, caption, description, localization
+                extracted_image_base64, workout_json = await asyncio.gather(
+                    self._extract_preview_image(
+                        job_id,
+                        self.video_processor.extract_first_frame(video_content),
+                        "first frame from video",
+                    ),
+                    self.genai_pool.analyze_video(
+                        video_content, transcript, caption, description, localization
+                    ),
                 )
 
             if not workout_json:
@@ -210,16 +217,19 @@ class VideoWorker:
                 "worker_id": WORKER_ID,
                 "platform": metadata_dict.get("platform", "unknown"),
             }
-            await self.cache_service.cache_video(url, workout_json, cache_metadata, localization)
 
-            # 6. Mark job complete
-            await self.queue_service.mark_job_complete(job_id, workout_json)
+            # 6. Mark job complete. The writes are independent, so the cache
+            # write (run in a worker thread) overlaps the queue update
+            await asyncio.gather(
+                self.cache_service.cache_video(url, workout_json, cache_metadata, localization),
+                self.queue_service.mark_job_complete(job_id, workout_json),
+            )
 
-            process_time = time.time() - start_time
+            process_time = (time.monotonic_ns() - start_ns) / 1e9
             logger.info(f"Job {job_id} - Completed successfully in {process_time:.2f}s")
 
         except Exception as e:
-            process_time = time.time() - start_time
+            process_time = (time.monotonic_ns() - start_ns) / 1e9
             # Ensure error message is a clean string without object references
             error_msg = f"{type(e).__name__}: {str(e)}"
             logger.error(f"Job {job_id} - Failed after {process_time:.2f}s: {error_msg}")
@@ -235,11 +245,22 @@ class VideoWorker:
             # Mark job as failed (will retry if under max attempts)
             await self.queue_service.mark_job_failed(job_id, error_msg)
 
+    async def _extract_preview_image(
+        self, job_id: str, extraction: Optional[Awaitable[bytes]], label: str
+    ) -> Optional[str]:
+        """Await an image extraction and return it as a JPEG data URI, or None if it failed"""
+        if extraction is None:
+            return None
+        try:
+            image = await extraction
+        except Exception as e:
+            logger.warning(f"Job {job_id} - Failed to extract {label}: {e}")
+            return None
+        logger.info(f"Job {job_id} - Extracted {label}")
+        return f"data:image/jpeg;base64,{base64.b64encode(image).decode('utf-8')}"
+
     def _is_retryable_error(self, error: Exception) -> bool:
         """Determine if an error is worth retrying"""
-        # Import here to avoid circular imports
-        from src.exceptions import VideoFormatError, UnsupportedPlatformError
-        
         # Non-retryable errors
         non_retryable_types = (
             VideoFormatError,
@@ -257,19 +278,8 @@ class VideoWorker:
         
         # Check error message for non-retryable patterns
         error_msg = str(error).lower()
-        non_retryable_patterns = [
-            "invalid url",
-            "malformed url", 
-            "video not found",
-            "private video",
-            "video unavailable",
-            "unsupported format",
-            "invalid video id",
-        ]
-        
-        for pattern in non_retryable_patterns:
-            if pattern in error_msg:
-                return False
+        if any(pattern in error_msg for pattern in _NON_RETRYABLE_PATTERNS):
+            return False
         
         # Default to retryable for network/API errors
         return True
@@ -336,7 +346,11 @@ class VideoWorker:
                         )
                         
                         if self._consecutive_empty_polls > 1:
-                            logger.debug(f"No jobs found, backing off for {backoff_time:.1f}s (attempt {self._consecutive_empty_polls})")
+                            logger.debug(
+                                "No jobs found, backing off for %.1fs (attempt %s)",
+                                backoff_time,
+                                self._consecutive_empty_polls,
+                            )
                         
                         await asyncio.sleep(backoff_time)
                 else:
@@ -463,13 +477,12 @@ async def queue_health():
             return {"error": "Queue service not available"}
         
         # Count jobs by status
-        pending = len(list(queue_service.queue_collection.where('status', '==', 'pending').stream()))
-        processing = len(list(queue_service.queue_collection.where('status', '==', 'processing').stream()))
+        pending = count_documents(queue_service.queue_collection.where('status', '==', 'pending'))
+        processing = count_documents(queue_service.queue_collection.where('status', '==', 'processing'))
         
         # Check for any old jobs that might be accumulating
-        from datetime import timedelta
         old_cutoff = datetime.now(timezone.utc) - timedelta(hours=24)
-        old_jobs = len(list(queue_service.queue_collection.where('created_at', '<', old_cutoff).stream()))
+        old_jobs = count_documents(queue_service.queue_collection.where('created_at', '<', old_cutoff))
         
         return {
             "queue_status": {
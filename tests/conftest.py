@@ -225,8 +225,6 @@ def mock_video_processor():
         }
     )
     
-    mock.remove_audio.return_value = b"silent_video_content"
-    
     return mock
 
 
@@ -4,6 +4,7 @@ Tests for video processing endpoints
 import pytest
 from unittest.mock import patch, AsyncMock
 from fastapi.testclient import TestClient
+from src.services.cache_service import CacheService
 
 
 @pytest.mark.unit
@@ -104,7 +105,6 @@ def test_process_endpoint_with_localization(
             b"fake_video_content",
             {"is_slideshow": False, "transcript_text": "test transcript", "caption": "test caption"}
         ))
-        mock_video_processor.remove_audio = AsyncMock(return_value=b"silent_video")
         
         # Mock successful GenAI analysis (async method)
         mock_genai_service.analyze_video_with_transcript = AsyncMock(return_value={
@@ -238,3 +238,110 @@ def test_process_endpoint_request_validation():
     # Missing URL
     with pytest.raises(ValidationError):
         ProcessRequest()
+
+
+def _hook_analysis(formula: str) -> dict:
+    """Minimal hook analysis that passes response validation"""
+    return {
+        "hook_formula": formula,
+        "hook_formula_name": formula.title(),
+        "explanation": "Test explanation",
+        "why_it_works": ["Test reason"],
+        "replicable_pattern": "Stop [doing thing]",
+    }
+
+
+def _setup_direct_processing_with_hook(
+    mock_cache_service, mock_queue_service, mock_genai_service, mock_video_processor
+):
+    """Configure mocks for a direct processing run whose result has a hook"""
+    mock_cache_service.get_cached_video = AsyncMock(return_value=None)
+    mock_cache_service.cache_video = AsyncMock(return_value=None)
+    mock_cache_service.generate_llm_cache_key = CacheService.generate_llm_cache_key
+    mock_cache_service.cache_llm_response = AsyncMock(return_value=True)
+    mock_queue_service.get_job_by_url = AsyncMock(return_value=None)
+    mock_video_processor.download_video = AsyncMock(return_value=(
+        b"fake_video_content",
+        {"is_slideshow": False, "transcript_text": "test transcript", "caption": "test caption"}
+    ))
+    mock_video_processor.extract_first_frame = AsyncMock(return_value=b"frame")
+    mock_genai_service.model = "test-model"
+    mock_genai_service.analyze_video_with_transcript = AsyncMock(return_value={
+        "title": "Test Video",
+        "hook": "Stop scrolling",
+        "transcript": "Stop scrolling, here is why",
+    })
+    mock_genai_service.analyze_hook = AsyncMock(return_value=_hook_analysis("command"))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cached_analysis", [None, _hook_analysis("cached")])
+def test_process_endpoint_hook_analysis_cache(
+    client: TestClient,
+    valid_tiktok_url: str,
+    cached_analysis,
+    mock_cache_service,
+    mock_queue_service,
+    mock_genai_service,
+    mock_video_processor
+):
+    """Test hook analysis is read through the LLM response cache"""
+    with patch('src.api.process.cache_service', mock_cache_service), \
+         patch('src.api.process.queue_service', mock_queue_service), \
+         patch('src.api.process.genai_service', mock_genai_service), \
+         patch('src.api.process.video_processor', mock_video_processor), \
+         patch('src.api.process.active_direct_processing', 0), \
+         patch('src.api.process.MAX_DIRECT_PROCESSING', 5):
+
+        _setup_direct_processing_with_hook(
+            mock_cache_service, mock_queue_service, mock_genai_service, mock_video_processor
+        )
+        mock_cache_service.get_cached_llm_response = AsyncMock(return_value=cached_analysis)
+
+        response = client.post("/process", json={"url": valid_tiktok_url})
+
+        assert response.status_code == 200
+        assert response.json()["title"] == "Test Video"
+        if cached_analysis:
+            assert response.json()["analysis"] == cached_analysis
+            mock_genai_service.analyze_hook.assert_not_called()
+            mock_cache_service.cache_llm_response.assert_not_called()
+        else:
+            mock_genai_service.analyze_hook.assert_called_once()
+            mock_cache_service.cache_llm_response.assert_called_once()
+            cache_key, analysis = mock_cache_service.cache_llm_response.call_args[0]
+            assert cache_key == mock_cache_service.get_cached_llm_response.call_args[0][0]
+            assert analysis == _hook_analysis("command")
+
+
+@pytest.mark.unit
+def test_process_endpoint_existing_job_processing(
+    client: TestClient,
+    valid_tiktok_url: str,
+    mock_cache_service,
+    mock_queue_service
+):
+    """Test process endpoint reports a job that is already being processed"""
+    with patch('src.api.process.cache_service', mock_cache_service), \
+         patch('src.api.process.queue_service', mock_queue_service):
+
+        mock_cache_service.get_cached_video.return_value = None
+        mock_queue_service.get_job_by_url.return_value = {
+            "job_id": "processing_job_789",
+            "status": "processing"
+        }
+
+        response = client.post("/process", json={
+            "url": valid_tiktok_url
+        })
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["status"] == "processing"
+        assert data["job_id"] == "processing_job_789"
+        assert data["check_url"] == "/status/processing_job_789"
+
+        # Queued and in-flight jobs come from a single lookup
+        mock_queue_service.get_job_by_url.assert_called_once_with(
+            valid_tiktok_url, localization=None, statuses=["pending", "processing"]
+        )
@@ -30,7 +30,6 @@ def test_full_video_processing_pipeline(client: TestClient, sample_workout_json:
             b"fake_video_content",
             {"is_slideshow": False, "transcript_text": "Test transcript", "caption": "Test caption"}
         ))
-        mock_processor.remove_audio = AsyncMock(return_value=b"silent_video")
         
         # Mock successful GenAI analysis (async method)
         mock_genai.analyze_video_with_transcript = AsyncMock(return_value=sample_workout_json)
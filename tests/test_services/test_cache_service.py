@@ -0,0 +1,109 @@
+"""
+Tests for the cached model responses in the cache service
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch, MagicMock
+from src.services.cache_service import CacheService
+
+
+@pytest.fixture
+def cache_service():
+    """Cache service backed by a mocked Firestore client"""
+    with patch('src.services.cache_service.get_firestore_client') as mock_client:
+        mock_client.return_value = MagicMock()
+        service = CacheService()
+    return service
+
+
+def set_llm_cache_doc(service, data):
+    """Make the llm_cache document read return data (None for a missing doc)"""
+    doc = MagicMock()
+    doc.exists = data is not None
+    doc.to_dict.return_value = data
+    service.llm_cache_collection.document.return_value.get.return_value = doc
+
+
+@pytest.mark.unit
+def test_generate_llm_cache_key_is_stable():
+    """Test the same inputs always produce the same key"""
+    key = CacheService.generate_llm_cache_key("gemini", "v1", "hook", "transcript")
+
+    assert key == CacheService.generate_llm_cache_key("gemini", "v1", "hook", "transcript")
+    assert len(key) == 64
+
+
+@pytest.mark.unit
+def test_generate_llm_cache_key_depends_on_order():
+    """Test the key changes when inputs swap positions"""
+    assert CacheService.generate_llm_cache_key("a", "b") != CacheService.generate_llm_cache_key(
+        "b", "a"
+    )
+    assert CacheService.generate_llm_cache_key(
+        "gemini", "v1", "hook"
+    ) != CacheService.generate_llm_cache_key("gemini", "v2", "hook")
+
+
+@pytest.mark.unit
+def test_generate_llm_cache_key_normalizes_inputs():
+    """Test surrounding whitespace is ignored and None matches an empty input"""
+    assert CacheService.generate_llm_cache_key(
+        "gemini", "  hook \n", None
+    ) == CacheService.generate_llm_cache_key("gemini", "hook", "")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_cached_llm_response_hit(cache_service):
+    """Test an unexpired entry returns the cached response"""
+    set_llm_cache_doc(cache_service, {
+        "response": {"hook_type": "question"},
+        "expires_at": datetime.now(timezone.utc) + timedelta(hours=1),
+    })
+
+    assert await cache_service.get_cached_llm_response("key") == {"hook_type": "question"}
+    cache_service.llm_cache_collection.document.assert_called_with("key")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_cached_llm_response_miss(cache_service):
+    """Test a missing entry returns None"""
+    set_llm_cache_doc(cache_service, None)
+
+    assert await cache_service.get_cached_llm_response("key") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_cached_llm_response_expired(cache_service):
+    """Test an expired entry is treated as a miss"""
+    set_llm_cache_doc(cache_service, {
+        "response": {"hook_type": "question"},
+        "expires_at": datetime.now(timezone.utc) - timedelta(seconds=1),
+    })
+
+    assert await cache_service.get_cached_llm_response("key") is None
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_cache_llm_response_sets_expiry(cache_service):
+    """Test cached responses are written with an expiry for the TTL policy"""
+    assert await cache_service.cache_llm_response("key", {"hook_type": "question"}) is True
+
+    data = cache_service.llm_cache_collection.document.return_value.set.call_args[0][0]
+    assert data["response"] == {"hook_type": "question"}
+    assert data["expires_at"] - data["created_at"] == timedelta(
+        hours=cache_service.llm_cache_ttl_hours
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_llm_cache_without_firestore(cache_service):
+    """Test the LLM cache is a no-op when Firestore is unavailable"""
+    cache_service.db = None
+
+    assert await cache_service.get_cached_llm_response("key") is None
+    assert await cache_service.cache_llm_response("key", {"hook_type": "question"}) is False
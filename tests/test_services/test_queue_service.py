@@ -0,0 +1,65 @@
+"""
+Tests for queue service job lookups
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from src.services.queue_service import QueueService
+
+
+URL = "https://www.tiktok.com/@user/video/1234567890"
+
+
+@pytest.fixture
+def queue_service():
+    """Queue service whose queue collection returns one matching job"""
+    with patch('src.services.queue_service.get_firestore_client') as mock_client:
+        mock_client.return_value = MagicMock()
+        service = QueueService()
+
+    doc = MagicMock()
+    doc.id = "job_1"
+    doc.to_dict.return_value = {"url": URL, "status": "processing"}
+
+    query = MagicMock()
+    query.where.return_value = query
+    query.order_by.return_value = query
+    query.limit.return_value = query
+    query.stream.return_value = [doc]
+    service.queue_collection = query
+    return service
+
+
+def status_filters(service):
+    """(op, value) of the status filters applied to the lookup query"""
+    filters = [call.kwargs["filter"] for call in service.queue_collection.where.call_args_list]
+    return [(f.op_string, f.value) for f in filters if f.field_path == "status"]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_job_by_url_statuses_single_query(queue_service):
+    """Test several statuses are matched with one 'in' filter"""
+    job = await queue_service.get_job_by_url(URL, statuses=["pending", "processing"])
+
+    assert job == {"job_id": "job_1", "url": URL, "status": "processing"}
+    assert status_filters(queue_service) == [("in", ["pending", "processing"])]
+    queue_service.queue_collection.stream.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_job_by_url_single_status(queue_service):
+    """Test a single status is matched with an equality filter"""
+    await queue_service.get_job_by_url(URL, status="pending")
+
+    assert status_filters(queue_service) == [("==", "pending")]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_get_job_by_url_rejects_status_and_statuses(queue_service):
+    """Test passing both status and statuses is an error"""
+    with pytest.raises(ValueError):
+        await queue_service.get_job_by_url(URL, status="pending", statuses=["processing"])
+
+    queue_service.queue_collection.stream.assert_not_called()
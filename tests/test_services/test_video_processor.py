@@ -1,9 +1,11 @@
 """
 Tests for video processor service
 """
+import asyncio
 import pytest
 import tempfile
 import os
+import time
 from unittest.mock import patch, Mock, AsyncMock
 from src.worker.video_processor import VideoProcessor
 from src.exceptions import UnsupportedPlatformError
@@ -122,113 +124,6 @@ async def test_download_video_unsupported_platform():
             await processor.download_video("https://youtube.com/watch?v=123")
 
 
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_remove_audio_success():
-    """Test successful audio removal from video"""
-    processor = VideoProcessor()
-    test_video_content = b"fake video content with audio"
-    processed_content = b"fake video content without audio"
-    
-    # Mock the temp_file context manager properly
-    with patch.object(processor, 'temp_file') as mock_temp_file:
-        # Create proper context manager mocks
-        mock_input_cm = Mock()
-        mock_input_cm.__enter__ = Mock(return_value='/tmp/input.mp4')
-        mock_input_cm.__exit__ = Mock(return_value=None)
-        
-        mock_output_cm = Mock()
-        mock_output_cm.__enter__ = Mock(return_value='/tmp/output.mp4')
-        mock_output_cm.__exit__ = Mock(return_value=None)
-        
-        # Configure temp_file to return different context managers for each call
-        mock_temp_file.side_effect = [mock_input_cm, mock_output_cm]
-        
-        # Mock file operations and ffmpeg
-        with patch('builtins.open', create=True) as mock_open, \
-             patch('ffmpeg.input') as mock_input, \
-             patch('ffmpeg.output') as mock_output:
-            
-            # Mock file read/write operations
-            mock_file = Mock()
-            mock_open.return_value.__enter__.return_value = mock_file
-            mock_file.read.return_value = processed_content
-            mock_file.write = Mock()  # Mock write operation
-            
-            # Mock ffmpeg pipeline
-            mock_stream = Mock()
-            mock_input.return_value = mock_stream
-            mock_output.return_value = mock_stream
-            mock_stream.overwrite_output.return_value = mock_stream
-            mock_stream.run = Mock()
-            
-            result = await processor.remove_audio(test_video_content)
-            
-            assert result == processed_content
-            
-            # Verify temp files were used
-            assert mock_temp_file.call_count == 2
-            # Verify context managers were entered
-            mock_input_cm.__enter__.assert_called_once()
-            mock_output_cm.__enter__.assert_called_once()
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_remove_audio_ffmpeg_error():
-    """Test audio removal with FFmpeg error"""
-    processor = VideoProcessor()
-    test_video_content = b"fake video content"
-    
-    with patch('ffmpeg.input'), \
-         patch('ffmpeg.output'), \
-         patch('ffmpeg.run') as mock_run:
-        
-        # Mock FFmpeg error
-        import ffmpeg
-        error = ffmpeg.Error("ffmpeg", "stdout", "stderr error message")
-        mock_run.side_effect = error
-        
-        with pytest.raises(Exception, match="Video processing failed"):
-            await processor.remove_audio(test_video_content)
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_remove_audio_empty_output():
-    """Test audio removal with empty output file"""
-    processor = VideoProcessor()
-    test_video_content = b"fake video content"
-    
-    with patch('ffmpeg.input'), \
-         patch('ffmpeg.output'), \
-         patch('ffmpeg.run'), \
-         patch('builtins.open', create=True) as mock_open:
-        
-        # Mock empty output file
-        mock_file = Mock()
-        mock_open.return_value.__enter__.return_value = mock_file
-        mock_file.read.return_value = b""  # Empty output
-        
-        with pytest.raises(Exception, match="FFmpeg produced empty output file"):
-            await processor.remove_audio(test_video_content)
-
-
-@pytest.mark.unit
-@pytest.mark.asyncio
-async def test_remove_audio_file_write_error():
-    """Test audio removal with file write error"""
-    processor = VideoProcessor()
-    test_video_content = b"fake video content"
-    
-    with patch('builtins.open', create=True) as mock_open:
-        # Mock file write error
-        mock_open.side_effect = IOError("Permission denied")
-        
-        with pytest.raises(Exception, match="Failed to write video content"):
-            await processor.remove_audio(test_video_content)
-
-
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_extract_first_frame_success():
@@ -266,21 +161,20 @@ async def test_extract_first_frame_success():
             mock_stream = Mock()
             mock_input.return_value = mock_stream
             mock_stream.output = Mock(return_value=mock_stream)
-            mock_stream.overwrite_output = Mock(return_value=mock_stream)
-            mock_stream.run = Mock()
+            mock_stream.run = Mock(return_value=(extracted_frame, b""))
             
             result = await processor.extract_first_frame(test_video_content)
             
             assert result == extracted_frame
             
-            # Verify temp files were used
-            assert mock_temp_file.call_count == 2
+            # Only the input goes through a temp file; the frame is read from stdout
+            assert mock_temp_file.call_count == 1
             # Verify ffmpeg was configured correctly
             mock_stream.output.assert_called_once()
             # Check that vframes=1 was passed
             call_kwargs = mock_stream.output.call_args[1]
             assert call_kwargs['vframes'] == 1
-            assert call_kwargs['f'] == 'image2'
+            assert call_kwargs['f'] == 'image2pipe'
             assert call_kwargs['vcodec'] == 'mjpeg'
 
 
@@ -325,6 +219,36 @@ async def test_extract_first_frame_ffmpeg_error():
                 await processor.extract_first_frame(test_video_content)
 
 
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_extract_first_frame_does_not_block_event_loop():
+    """Test frame extraction overlaps with work it is gathered with, like the Gemini call"""
+    processor = VideoProcessor()
+    events = []
+
+    def slow_run(**kwargs):
+        time.sleep(0.2)
+        events.append("ffmpeg finished")
+        return b"fake jpeg frame data", b""
+
+    async def analysis():
+        await asyncio.sleep(0.05)
+        events.append("analysis finished")
+
+    with patch('ffmpeg.input') as mock_input:
+        mock_stream = Mock()
+        mock_input.return_value = mock_stream
+        mock_stream.output.return_value = mock_stream
+        mock_stream.run = Mock(side_effect=slow_run)
+
+        frame, _ = await asyncio.gather(
+            processor.extract_first_frame(b"fake video content"), analysis()
+        )
+
+    assert frame == b"fake jpeg frame data"
+    assert events == ["analysis finished", "ffmpeg finished"]
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_extract_first_frame_empty_output():
@@ -370,8 +294,7 @@ async def test_extract_first_frame_empty_output():
             mock_stream = Mock()
             mock_input.return_value = mock_stream
             mock_stream.output.return_value = mock_stream
-            mock_stream.overwrite_output.return_value = mock_stream
-            mock_stream.run = Mock()
+            mock_stream.run = Mock(return_value=(b"", b""))  # Empty output
             
             from src.exceptions import VideoProcessingError
             with pytest.raises(VideoProcessingError, match="Frame extraction failed"):
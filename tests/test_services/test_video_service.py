@@ -0,0 +1,138 @@
+"""
+Tests for video service
+"""
+import pytest
+from unittest.mock import patch, MagicMock
+from google.api_core import exceptions
+from google.cloud import firestore
+from src.services.video_service import VideoService
+
+
+VIDEO_URL = "https://www.tiktok.com/@user/video/1234567890"
+VIDEO_DATA = {"title": "Test Video", "platform": "tiktok"}
+
+
+@pytest.fixture
+def video_service():
+    """Video service backed by a mocked Firestore client"""
+    with patch('src.services.video_service.get_firestore_client') as mock_client:
+        mock_client.return_value = MagicMock()
+        service = VideoService()
+    return service
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_save_video_new(video_service):
+    """Test first save creates the video in one commit without retries"""
+    batch = MagicMock()
+    video_service.db.batch.return_value = batch
+
+    result = await video_service.save_video(VIDEO_URL, VIDEO_DATA)
+
+    assert result["success"] is True
+    assert result["is_new"] is True
+    video_service.db.batch.assert_called_once()
+    video_entry = batch.create.call_args[0][1]
+    assert video_entry["save_count"] == 1
+    assert batch.commit.call_args.kwargs["retry"] is None
+    batch.update.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_save_video_existing_increments_save_count(video_service):
+    """Test AlreadyExists on create falls back to incrementing save_count"""
+    create_batch = MagicMock()
+    create_batch.commit.side_effect = exceptions.AlreadyExists("exists")
+    update_batch = MagicMock()
+    video_service.db.batch.side_effect = [create_batch, update_batch]
+
+    result = await video_service.save_video(VIDEO_URL, VIDEO_DATA)
+
+    assert result["success"] is True
+    assert result["is_new"] is False
+    update_batch.update.assert_called_once()
+    update = update_batch.update.call_args[0][1]
+    assert isinstance(update["save_count"], firestore.Increment)
+    assert update["save_count"].value == 1
+    update_batch.commit.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_save_video_create_not_retried(video_service):
+    """Test a create whose response is lost is not retried into a second increment"""
+    create_batch = MagicMock()
+    create_batch.commit.side_effect = exceptions.DeadlineExceeded("timeout")
+    video_service.db.batch.return_value = create_batch
+
+    result = await video_service.save_video(VIDEO_URL, VIDEO_DATA)
+
+    assert result["success"] is False
+    create_batch.commit.assert_called_once()
+    assert create_batch.commit.call_args.kwargs["retry"] is None
+    # No fallback batch, so save_count is never incremented
+    video_service.db.batch.assert_called_once()
+    create_batch.update.assert_not_called()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_save_video_new_user_save_has_defaults(video_service):
+    """Test a first save writes empty tags, notes and collections"""
+    batch = MagicMock()
+    video_service.db.batch.return_value = batch
+
+    await video_service.save_video(VIDEO_URL, VIDEO_DATA, user_id="user_1")
+
+    user_video_data = batch.set.call_args[0][1]
+    assert user_video_data["user_tags"] == []
+    assert user_video_data["user_notes"] is None
+    assert user_video_data["collections"] == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_save_video_existing_video_new_user_save(video_service):
+    """Test saving an existing video creates the user's save with defaults"""
+    create_batch = MagicMock()
+    create_batch.commit.side_effect = exceptions.AlreadyExists("exists")
+    update_batch = MagicMock()
+    video_service.db.batch.side_effect = [create_batch, update_batch]
+
+    result = await video_service.save_video(
+        VIDEO_URL, VIDEO_DATA, user_id="user_1", user_tags=["hooks"]
+    )
+
+    assert result["is_new"] is False
+    user_video_data = update_batch.create.call_args[0][1]
+    assert user_video_data["user_tags"] == ["hooks"]
+    assert user_video_data["collections"] == []
+    update_batch.update.assert_called_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_save_video_existing_user_save_merges(video_service):
+    """Test re-saving merges tags into the user's existing save"""
+    create_batch = MagicMock()
+    create_batch.commit.side_effect = exceptions.AlreadyExists("exists")
+    user_create_batch = MagicMock()
+    user_create_batch.commit.side_effect = exceptions.AlreadyExists("exists")
+    merge_batch = MagicMock()
+    video_service.db.batch.side_effect = [create_batch, user_create_batch, merge_batch]
+
+    result = await video_service.save_video(
+        VIDEO_URL, VIDEO_DATA, user_id="user_1", user_tags=["hooks"]
+    )
+
+    assert result["success"] is True
+    merge_batch.update.assert_called_once()
+    user_video_data = merge_batch.set.call_args[0][1]
+    assert merge_batch.set.call_args.kwargs["merge"] is True
+    assert isinstance(user_video_data["user_tags"], firestore.ArrayUnion)
+    # Notes, collections and the original save time are left untouched
+    assert "user_notes" not in user_video_data
+    assert "collections" not in user_video_data
+    assert "saved_at" not in user_video_data
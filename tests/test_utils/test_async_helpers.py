@@ -0,0 +1,94 @@
+"""
+Tests for async helpers
+"""
+import asyncio
+import gc
+import inspect
+import warnings
+import pytest
+from src.utils.async_helpers import gather_with_concurrency
+
+
+class ConcurrencyTracker:
+    """Records the peak number of coroutines running at once"""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def run(self, value, delay=0.01):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(delay)
+            return value
+        finally:
+            self.running -= 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_gather_with_concurrency_preserves_order():
+    """Test results come back in input order, not completion order"""
+    tracker = ConcurrencyTracker()
+    coroutines = [tracker.run(i, delay=0.05 - i * 0.01) for i in range(5)]
+
+    results = await gather_with_concurrency(2, *coroutines)
+
+    assert results == [0, 1, 2, 3, 4]
+    assert tracker.peak == 2
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_gather_with_concurrency_empty():
+    """Test no coroutines returns an empty list"""
+    assert await gather_with_concurrency(3) == []
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_gather_with_concurrency_limit_below_one(limit):
+    """Test a limit below 1 still runs every coroutine, one at a time"""
+    tracker = ConcurrencyTracker()
+
+    results = await gather_with_concurrency(limit, *[tracker.run(i) for i in range(3)])
+
+    assert results == [0, 1, 2]
+    assert tracker.peak == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_gather_with_concurrency_limit_above_count():
+    """Test a limit above the number of coroutines runs them all at once"""
+    tracker = ConcurrencyTracker()
+
+    results = await gather_with_concurrency(10, *[tracker.run(i) for i in range(4)])
+
+    assert results == [0, 1, 2, 3]
+    assert tracker.peak == 4
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_gather_with_concurrency_error_closes_pending():
+    """Test an error propagates and coroutines that never started are closed"""
+    tracker = ConcurrencyTracker()
+
+    async def fail():
+        raise ValueError("download failed")
+
+    pending = [tracker.run(i) for i in range(3)]
+
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        with pytest.raises(ValueError, match="download failed"):
+            await gather_with_concurrency(1, fail(), *pending)
+        gc.collect()
+
+    for coro in pending:
+        assert inspect.getcoroutinestate(coro) == inspect.CORO_CLOSED
+    assert tracker.peak == 0
+    assert not [w for w in caught if "never awaited" in str(w.message)]
@@ -0,0 +1,42 @@
+"""
+Tests for image conversion helpers
+"""
+import pytest
+from src.utils.image_converter import memoize_by_content
+
+
+def make_doubler(**cache_options):
+    """Memoized conversion that doubles its input and records each real call"""
+    calls = []
+
+    @memoize_by_content(**cache_options)
+    def double(image_bytes: bytes) -> bytes:
+        calls.append(image_bytes)
+        return image_bytes * 2
+
+    return double, calls
+
+
+@pytest.mark.unit
+def test_memoize_by_content_evicts_by_total_bytes():
+    """Test the least recently used outputs are evicted once max_bytes is exceeded"""
+    double, calls = make_doubler(max_entries=10, max_bytes=10)
+
+    double(b"a")
+    double(b"bb")
+    double(b"ccc")  # 2 + 4 + 6 bytes evicts b"a"
+
+    double(b"bb")
+    assert calls == [b"a", b"bb", b"ccc"]
+    double(b"a")
+    assert calls == [b"a", b"bb", b"ccc", b"a"]
+
+
+@pytest.mark.unit
+def test_memoize_by_content_skips_oversized_outputs():
+    """Test an output larger than max_bytes is returned but not cached"""
+    double, calls = make_doubler(max_bytes=10)
+
+    assert double(b"x" * 6) == b"x" * 12
+    assert double(b"x" * 6) == b"x" * 12
+    assert len(calls) == 2
@@ -0,0 +1,92 @@
+"""
+Tests for request logging middleware
+"""
+import json
+import logging
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from src.utils.logging import RequestLoggingMiddleware
+
+
+LOGGER_NAME = "test_request_logging"
+
+
+@pytest.fixture
+def logging_client():
+    """Test client for a minimal app wrapped in RequestLoggingMiddleware"""
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping():
+        return {"ok": True}
+
+    app.add_middleware(RequestLoggingMiddleware, logger_name=LOGGER_NAME)
+
+    logger = logging.getLogger(LOGGER_NAME)
+    previous_level = logger.level
+    logger.setLevel(logging.INFO)
+    yield TestClient(app)
+    logger.setLevel(previous_level)
+
+
+def request_started_log(capsys) -> dict:
+    """Parse the 'Request started' line written to stdout"""
+    for line in capsys.readouterr().out.splitlines():
+        if line.startswith("{"):
+            entry = json.loads(line)
+            if entry.get("message") == "Request started":
+                return entry
+    raise AssertionError("No 'Request started' log line")
+
+
+@pytest.mark.unit
+def test_request_id_passed_through(logging_client, capsys):
+    """Test an incoming x-request-id is reused for logs and the response"""
+    response = logging_client.get("/ping", headers={"X-Request-ID": "abc123"})
+
+    assert response.headers["x-request-id"] == "abc123"
+    assert float(response.headers["x-process-time"]) >= 0
+    assert request_started_log(capsys)["request_id"] == "abc123"
+
+
+@pytest.mark.unit
+def test_request_id_generated_when_absent(logging_client, capsys):
+    """Test a request ID is generated when the header is missing"""
+    response = logging_client.get("/ping")
+
+    request_id = response.headers["x-request-id"]
+    assert len(request_id) == 16
+    int(request_id, 16)  # hex token, raises if not
+    assert request_started_log(capsys)["request_id"] == request_id
+
+
+@pytest.mark.unit
+def test_client_ip_uses_first_forwarded_hop(logging_client, capsys):
+    """Test the first X-Forwarded-For hop is logged as the client IP"""
+    logging_client.get(
+        "/ping", headers={"X-Forwarded-For": " 203.0.113.7 , 10.0.0.2, 10.0.0.3"}
+    )
+
+    assert request_started_log(capsys)["client_ip"] == "203.0.113.7"
+
+
+@pytest.mark.unit
+def test_client_ip_falls_back_to_real_ip_and_peer(logging_client, capsys):
+    """Test X-Real-IP is used without X-Forwarded-For, then the direct client"""
+    logging_client.get("/ping", headers={"X-Real-IP": "198.51.100.4"})
+    assert request_started_log(capsys)["client_ip"] == "198.51.100.4"
+
+    logging_client.get("/ping")
+    assert request_started_log(capsys)["client_ip"] == "testclient"
+
+
+@pytest.mark.unit
+def test_query_string_logged(logging_client, capsys):
+    """Test the raw query string is logged with the request"""
+    logging_client.get("/ping?url=abc&localization=es")
+
+    entry = request_started_log(capsys)
+    assert entry["query_params"] == "url=abc&localization=es"
+    assert entry["method"] == "GET"
+    assert entry["path"] == "/ping"